@@ -1,78 +1,95 @@
 import os
 import sys
-import importlib
+import importlib.util
 from pathlib import Path
-import subprocess
+import shutil
 import json
 
 
+REQUIRED_MODULES = ("requests", "pytest", "dotenv")
+REQUIRED_PATHS = (
+    ".checklists",
+    ".patches",
+    "orchestrator.py",
+    "cursor_client.py"
+)
+
+
 def check_dependencies():
     """Check if all required dependencies are installed and configured."""
+    artifacts_dir = Path("transition_artifacts")
+    log_file = artifacts_dir / "dependency_check.log"
+
     try:
         # Create test artifacts directory
-        artifacts_dir = Path("transition_artifacts")
         artifacts_dir.mkdir(exist_ok=True)
-        log_file = artifacts_dir / "dependency_check.log"
-
-        with open(log_file, "w", encoding="utf-8") as f:
-            f.write("🔄 Running Dependency Checks...\n\n")
-
-            f.write("🔍 Checking Environment Variables:\n")
-
-            # Check required modules
-            f.write("\n🔍 Checking Required Modules:\n")
-            required_modules = ["requests", "pytest", "dotenv"]
-            for module in required_modules:
-                try:
-                    importlib.import_module(module)
-                    f.write(f"✅ {module} is installed\n")
-                except ImportError:
-                    raise ImportError(f"{module} is not installed")
-
-            # Check required files and directories
-            f.write("\n🔍 Checking Required Files and Directories:\n")
-            required_paths = [
-                ".checklists",
-                ".patches",
-                "orchestrator.py",
-                "cursor_client.py"
-            ]
-
-            for path_str in required_paths:
-                path = Path(path_str)
-                if path.exists():
-                    f.write(
-                        f"✅ {path_str} {'directory' if path.is_dir() else 'file'} exists\n")
-                else:
-                    raise FileNotFoundError(f"{path_str} not found")
-
-            # Check Git setup
-            f.write("\n🔍 Checking Git Setup:\n")
+
+        # A single handle covers both the checks and any error report
+        with open(log_file, "w", encoding="utf-8", buffering=1 << 16) as f:
             try:
-                result = subprocess.run(
-                    ["git", "--version"],
-                    capture_output=True,
-                    text=True,
-                    check=True
-                )
-                f.write(f"✅ Git is available: {result.stdout.strip()}\n")
-            except (subprocess.CalledProcessError, FileNotFoundError):
-                raise EnvironmentError("Git is not installed or not in PATH")
-
-            # Test successful
-            result = {
-                "status": "success",
-                "artifacts": ["dependency_check.log"]
-            }
-
-    except Exception as e:
+                f.write("🔄 Running Dependency Checks...\n\n")
+
+                f.write("🔍 Checking Environment Variables:\n")
+
+                # Check required modules
+                f.write("\n🔍 Checking Required Modules:\n")
+                missing = []
+                for module in REQUIRED_MODULES:
+                    # find_spec locates the module without executing it
+                    if importlib.util.find_spec(module) is None:
+                        missing.append(f"{module} is not installed")
+                        f.write(f"❌ {module} is not installed\n")
+                    else:
+                        f.write(f"✅ {module} is installed\n")
+
+                # Check required files and directories
+                f.write("\n🔍 Checking Required Files and Directories:\n")
+                # One directory listing resolves existence and type for every
+                # top-level path instead of a stat call per path
+                with os.scandir(".") as it:
+                    entries = {entry.name: entry for entry in it}
+
+                for path_str in REQUIRED_PATHS:
+                    entry = entries.get(path_str)
+                    if entry is None:
+                        missing.append(f"{path_str} not found")
+                        f.write(f"❌ {path_str} not found\n")
+                    else:
+                        f.write(
+                            f"✅ {path_str} {'directory' if entry.is_dir() else 'file'} exists\n")
+
+                # Report every missing module and path together rather than one per run
+                if missing:
+                    raise EnvironmentError("; ".join(missing))
+
+                # Check Git setup
+                f.write("\n🔍 Checking Git Setup:\n")
+                # Resolving git on PATH is enough; no need to spawn it
+                git_path = shutil.which("git")
+                if not git_path:
+                    raise EnvironmentError("Git is not installed or not in PATH")
+                f.write(f"✅ Git is available: {git_path}\n")
+
+                # Test successful
+                result = {
+                    "status": "success",
+                    "artifacts": ["dependency_check.log"]
+                }
+
+            except Exception as e:
+                result = {
+                    "status": "failure",
+                    "error_message": str(e),
+                    "artifacts": ["dependency_check.log"]
+                }
+                f.write(f"\n❌ Error: {str(e)}\n")
+    except OSError as e:
+        # The log itself could not be created or written
         result = {
             "status": "failure",
             "error_message": str(e),
             "artifacts": ["dependency_check.log"]
         }
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"\n❌ Error: {str(e)}\n")
 
     print(json.dumps(result))
 
@@ -1,11 +1,39 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Callable, Dict, List, Optional, Any, Tuple, Union
 import os
 import json
-import requests
+import hashlib
+from functools import lru_cache
+import orjson
 from pathlib import Path
-from dotenv import load_dotenv
+
+
+# Parsed JSON files keyed by path, tagged with the (mtime, size) they were read at
+_JSON_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _parse_context_lines(raw: bytes) -> Dict[str, str]:
+    """Rebuild the {path: content} mapping from a JSONL context cache."""
+    context = {}
+    for line in raw.splitlines():
+        if line:
+            entry = json.loads(line)
+            context[entry["path"]] = entry["content"]
+    return context
+
+
+def _load_json_cached(path: Path,
+                      parse: Callable[[bytes], Dict[str, Any]] = json.loads) -> Dict[str, Any]:
+    """Load a JSON file, reusing the parsed result until the file changes on disk."""
+    st = path.stat()
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _JSON_CACHE.get(path)
+    if cached is None or cached[0] != stamp:
+        with open(path, "rb") as f:
+            cached = _JSON_CACHE[path] = (stamp, parse(f.read()))
+    # Hand out a copy so callers can't mutate the cached entry
+    return dict(cached[1])
 
 
 class AIServiceType(Enum):
@@ -21,6 +49,11 @@ class AIRequestType(Enum):
     DOCUMENTATION = "documentation"
 
 
+# Enum values resolved once rather than on every request
+_SERVICE_KEYS = {service: service.value for service in AIServiceType}
+_ENDPOINTS = {request_type: request_type.value for request_type in AIRequestType}
+
+
 @dataclass
 class AIRequest:
     service: AIServiceType
@@ -44,6 +77,13 @@ class CursorAIClient:
         self.config_dir = Path(config_dir)
         self.config_dir.mkdir(exist_ok=True)
 
+        # HTTP and dotenv are imported here so that importing the request and
+        # response dataclasses alone doesn't pull in requests/urllib3/ssl
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from dotenv import load_dotenv
+
         # Load environment variables
         load_dotenv()
 
@@ -56,21 +96,43 @@ class CursorAIClient:
         # Load service configurations
         self.service_configs = self._load_service_configs()
 
+        # URL and payload skeleton for each request type, built once per client
+        self._endpoints = {
+            request_type: (f"{self.api_base_url}/{endpoint}", {"type": endpoint})
+            for request_type, endpoint in _ENDPOINTS.items()
+        }
+
+        # Pooled session so consecutive requests reuse the same connection
+        self._session = requests.Session()
+        self._session.mount(
+            "https://", HTTPAdapter(
+                pool_connections=8, pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2)))
+        self._session.headers.update({"Content-Type": "application/json"})
+        if self.api_key:
+            self._session.headers["Authorization"] = f"Bearer {self.api_key}"
+
     def _load_service_configs(self) -> Dict[str, Any]:
         """Load service configurations from the config directory."""
         config_file = self.config_dir / "services.json"
-        if config_file.exists():
-            with open(config_file) as f:
-                return json.load(f)
-        return {}
+        try:
+            return _load_json_cached(config_file)
+        except FileNotFoundError:
+            return {}
 
     def save_service_config(self, service: AIServiceType, config: Dict[str, Any]) -> bool:
         """Save a service configuration."""
         try:
             self.service_configs[service.value] = config
             config_file = self.config_dir / "services.json"
-            with open(config_file, "w") as f:
-                json.dump(self.service_configs, f, indent=2)
+            tmp_file = config_file.with_suffix(".json.tmp")
+            # Write a sibling file and swap it in, so an interrupted save can
+            # never leave a truncated services.json behind
+            with open(tmp_file, "wb") as f:
+                f.write(orjson.dumps(self.service_configs))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, config_file)
             return True
         except Exception as e:
             print(f"Error saving service config: {e}")
@@ -121,32 +183,28 @@ class CursorAIClient:
         if not self.api_key:
             return AIResponse(False, "API key not configured", confidence=0.0)
 
-        service_config = self.service_configs.get(request.service.value, {})
+        service_config = self.service_configs.get(
+            _SERVICE_KEYS[request.service], {})
+        url, base_payload = self._endpoints[request.request_type]
 
         try:
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
-
+            # Fill the per-type skeleton; service-specific configuration wins
             payload = {
-                "type": request.request_type.value,
+                **base_payload,
                 "content": request.content,
                 "metadata": request.metadata or {},
-                "context_files": request.context_files or []
+                "context_files": request.context_files or [],
+                **service_config
             }
 
-            # Add service-specific configuration
-            payload.update(service_config)
-
-            response = requests.post(
-                f"{self.api_base_url}/{request.request_type.value}",
-                headers=headers,
-                json=payload
+            response = self._session.post(
+                url,
+                data=orjson.dumps(payload),
+                timeout=30
             )
 
             if response.status_code == 200:
-                data = response.json()
+                data = orjson.loads(response.content)
                 return AIResponse(
                     success=True,
                     content=data["content"],
@@ -173,18 +231,20 @@ class CursorAIClient:
         cache_dir = self.config_dir / "context_cache"
         cache_dir.mkdir(exist_ok=True)
 
-        cache_id = str(hash(tuple(sorted(files))))
-        cache_path = cache_dir / f"{cache_id}.json"
+        # Deterministic across interpreter runs, unlike the salted built-in hash()
+        cache_id = hashlib.blake2b(
+            "\0".join(sorted(files)).encode("utf-8"), digest_size=16).hexdigest()
+        cache_path = cache_dir / f"{cache_id}.jsonl"
 
         try:
-            context_data = {}
-            for file_path in files:
-                if Path(file_path).exists():
-                    with open(file_path) as f:
-                        context_data[file_path] = f.read()
-
-            with open(cache_path, "w") as f:
-                json.dump(context_data, f)
+            # One JSON line per file, so only a single file is held in memory at a time
+            with open(cache_path, "wb", buffering=1 << 20) as out:
+                for file_path in files:
+                    if Path(file_path).exists():
+                        with open(file_path) as f:
+                            entry = {"path": file_path, "content": f.read()}
+                        out.write(json.dumps(entry).encode("utf-8"))
+                        out.write(b"\n")
 
             return cache_id
 
@@ -194,14 +254,14 @@ class CursorAIClient:
 
     def get_cached_context(self, cache_id: str) -> Dict[str, str]:
         """Retrieve cached context files."""
-        cache_path = self.config_dir / "context_cache" / f"{cache_id}.json"
+        cache_path = self.config_dir / "context_cache" / f"{cache_id}.jsonl"
 
-        if cache_path.exists():
-            try:
-                with open(cache_path) as f:
-                    return json.load(f)
-            except Exception as e:
-                print(f"Error loading cached context: {e}")
+        try:
+            return _load_json_cached(cache_path, _parse_context_lines)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            print(f"Error loading cached context: {e}")
 
         return {}
 
@@ -261,3 +321,15 @@ class CursorAIClient:
             metadata={"action": "process_prompt"}
         )
         return self._make_request(request)
+
+
+@lru_cache(maxsize=8)
+def get_client(config_dir: str = ".cursor_ai") -> CursorAIClient:
+    """
+    Return a shared CursorAIClient for the given config directory.
+    Prefer this over constructing CursorAIClient directly so the environment
+    is only read once and the HTTP session is reused.
+    :param config_dir: Directory holding the client configuration.
+    :return: The cached client instance.
+    """
+    return CursorAIClient(config_dir)
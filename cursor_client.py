@@ -1,7 +1,10 @@
 import os
+import shlex
+import shutil
 import subprocess
+import tempfile
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional, Union
 from pathlib import Path
 
 
@@ -43,30 +46,50 @@ class FileOperations:
             if not file_path.exists():
                 return OperationResult(False, error=f"Target file not found: {file_path}")
 
-            with open(file_path, 'r') as f:
-                lines = f.readlines()
-
-            # Ensure line number is valid
-            if line < 1 or line > len(lines) + 1:
+            if line < 1:
                 return OperationResult(False, error=f"Invalid line number: {line}")
 
-            # Insert the snippet
-            lines.insert(line - 1, snippet + '\n')
-
-            with open(file_path, 'w') as f:
-                f.writelines(lines)
+            # Stream into a sibling temp file so large files are never held in memory
+            tmp = tempfile.NamedTemporaryFile(
+                "wb", dir=file_path.parent, delete=False, buffering=1 << 20)
+            try:
+                with open(file_path, 'rb', buffering=1 << 20) as src, tmp:
+                    for _ in range(line - 1):
+                        chunk = src.readline()
+                        if not chunk:
+                            # Ran out of lines before reaching the insertion point
+                            tmp.close()
+                            os.unlink(tmp.name)
+                            return OperationResult(False, error=f"Invalid line number: {line}")
+                        tmp.write(chunk)
+
+                    # Insert the snippet, then copy the remainder in large chunks
+                    tmp.write(snippet.encode('utf-8') + b'\n')
+                    shutil.copyfileobj(src, tmp, length=1 << 20)
+
+                shutil.copymode(file_path, tmp.name)
+                os.replace(tmp.name, file_path)
+            except BaseException:
+                if os.path.exists(tmp.name):
+                    os.unlink(tmp.name)
+                raise
 
             return OperationResult(True, content=f"Snippet inserted at line {line}")
 
         except Exception as e:
             return OperationResult(False, error=str(e))
 
-    def run_command(self, command: str) -> OperationResult:
-        """Run a shell command."""
+    def run_command(self, command: Union[str, List[str]]) -> OperationResult:
+        """Run a command directly, without an intermediate shell.
+
+        String commands are split with shell-like quoting rules; pass an
+        argument list to avoid the split entirely.
+        """
         try:
+            args = shlex.split(command) if isinstance(command, str) else command
             result = subprocess.run(
-                command,
-                shell=True,
+                args,
+                shell=False,
                 capture_output=True,
                 text=True
             )
@@ -1,22 +1,39 @@
 import os
-import requests
 from typing import Dict, Any, Optional
-from dotenv import load_dotenv
 
 
 class LMStudioClient:
     """Client for interacting with LMStudio's API."""
 
-    def __init__(self, api_endpoint: str = "http://localhost:1234/v1/chat/completions"):
-        """Initialize the LMStudio AI client."""
+    def __init__(self, api_endpoint: str = "http://localhost:1234/v1/chat/completions",
+                 session: Optional["requests.Session"] = None):
+        """
+        Initialize the LMStudio AI client.
+        Pass a session to share its connection pool with other callers.
+        """
+        # Deferred so importing this module stays cheap
+        import requests
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        from dotenv import load_dotenv
+
         load_dotenv()
         self.api_endpoint = api_endpoint
+        if session is not None:
+            self._session = session
+        else:
+            # Keep-alive session reused across prompts, retrying dropped connections
+            self._session = requests.Session()
+            adapter = HTTPAdapter(
+                pool_connections=8, pool_maxsize=32,
+                max_retries=Retry(total=3, backoff_factor=0.2))
+            self._session.mount("http://", adapter)
+            self._session.mount("https://", adapter)
+        self._session.headers.update({"Content-Type": "application/json"})
 
     def generate_prompt(self, context: Dict[str, Any]) -> str:
         """Generate a prompt based on the provided context."""
-        headers = {
-            "Content-Type": "application/json"
-        }
+        import requests
 
         # Format the context into a chat message
         task_desc = context.get("task_description", "")
@@ -51,9 +68,8 @@ class LMStudioClient:
         }
 
         try:
-            response = requests.post(
+            response = self._session.post(
                 self.api_endpoint,
-                headers=headers,
                 json=payload,
                 timeout=60
             )
@@ -3,230 +3,828 @@ from external_ai_integration import LMStudioClient
 from validation_system.blockers.auto_blocker_resolver import BlockerResolver
 from validation_system.core import TransitionValidator
 from pathlib import Path
-import json
-import subprocess
+import atexit
+import orjson
+import xxhash
+import os
+import threading
+import time
 import argparse
+import asyncio
+import re
+import shlex
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from contextlib import contextmanager, redirect_stderr, redirect_stdout
+import ast
+import importlib.util
+import io
+import logging
+import logging.handlers
+import sys
+import traceback
+
+try:
+    # Faster event loop for the many concurrent task subprocesses, if installed
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+# Seconds between background flushes of a changed status file
+STATUS_FLUSH_INTERVAL = 0.25
+
+# Status transitions are appended to a journal; the full snapshot is only
+# rewritten once this many events have piled up
+JOURNAL_COMPACT_EVERY = 1000
+
+# Throwaway runs (e.g. status on tmpfs) can skip the atomic temp-file swap
+EPHEMERAL_STATUS = os.environ.get("SMOOTHOP_STATUS_EPHEMERAL") == "1"
+
+# Commands containing any of these need a shell to be interpreted correctly
+_SHELL_METACHARS = re.compile(r"[|&;<>()$`\\*?~\n]")
+
+# Subprocess stream targets; stdout nobody reads goes to the null device
+_PIPE = asyncio.subprocess.PIPE
+_DEVNULL = asyncio.subprocess.DEVNULL
+
+# Per-task command output logs, laid out as <phase>/<task>.log
+TASK_LOG_DIR = Path("transition_artifacts") / "logs"
+_UNSAFE_PATH_CHARS = re.compile(r"[^\w.-]+")
+
+# LMStudio answers to blocker checks, kept across runs
+LLM_CACHE_PATH = Path("transition_artifacts") / ".llm_cache.sqlite"
+
+# Parsed checklists, reused while the checklist file is unchanged
+PLAN_CACHE_DIR = Path("transition_artifacts") / ".plan_cache"
+
+# How much of a failed task's log is reported as its error
+_ERROR_TAIL_BYTES = 4096
+
+# Progress output is buffered and written at phase boundaries, or straight
+# away for errors, rather than one write per message
+log = logging.getLogger("orchestrator")
+_log_handler = logging.handlers.MemoryHandler(
+    capacity=64, flushLevel=logging.ERROR,
+    target=logging.StreamHandler(sys.stdout))
+_log_handler.target.setFormatter(logging.Formatter("%(message)s"))
+log.addHandler(_log_handler)
+log.setLevel(logging.INFO)
+log.propagate = False
+
+STATUS_EMOJI = {
+    "not_started": "⚪",
+    "in_progress": "🔄",
+    "completed": "✅",
+    "failed": "❌",
+    "blocked": "⛔"
+}
+
+# display_status line templates, built once
+_CHECKLIST_HEADER_TPL = "📋 Checklist: {name}\n"
+_DIVIDER = "=" * 50
+_PHASE_HEADER_TPL = "{emoji} Phase: {name} [{status}]\n"
+_GATE_LINE_TPL = "   🎯 Success Gate: {metric} (min: {min_value})\n"
+_TASK_LINE_TPL = "   {emoji} {desc} [{status}]\n"
+
+
+def _read_tail(path: Path, size: int = _ERROR_TAIL_BYTES) -> str:
+    """Return the last ``size`` bytes of a log file, decoded for display."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        f.seek(max(0, f.tell() - size))
+        return f.read().decode(errors="replace")
+
+
+def _check_integration_test_coverage(gate: Dict[str, Any]) -> bool:
+    """Success gate for the integration_test_coverage metric."""
+    # TODO: Implement coverage check
+    return True
+
+
+def _check_api_test_coverage(gate: Dict[str, Any]) -> bool:
+    """Success gate for the api_test_coverage metric."""
+    # TODO: Implement API coverage check
+    return True
+
+
+def _check_validation_coverage(gate: Dict[str, Any]) -> bool:
+    """Success gate for the validation_coverage metric."""
+    # TODO: Implement validation coverage check
+    return True
+
+
+def _check_unknown_metric(gate: Dict[str, Any]) -> bool:
+    """Metrics without a dedicated check pass by default."""
+    return True
+
+
+_GATE_CHECKS: Dict[str, Callable[[Dict[str, Any]], bool]] = {
+    "integration_test_coverage": _check_integration_test_coverage,
+    "api_test_coverage": _check_api_test_coverage,
+    "validation_coverage": _check_validation_coverage,
+}
+
+
+# How each validation script's __main__ guard uses main(), keyed by
+# (path, mtime): True for sys.exit(main()), False for a bare main(), None
+# for scripts that have to run in their own interpreter
+_validation_cache: Dict[Tuple[str, int], Optional[bool]] = {}
+
+
+def _is_main_guard(node: ast.stmt) -> bool:
+    """Whether a top-level statement is ``if __name__ == "__main__":``."""
+    if not isinstance(node, ast.If) or not isinstance(node.test, ast.Compare):
+        return False
+    test = node.test
+    return (isinstance(test.left, ast.Name) and test.left.id == "__name__"
+            and len(test.comparators) == 1
+            and isinstance(test.comparators[0], ast.Constant)
+            and test.comparators[0].value == "__main__")
+
+
+def _is_main_call(node: ast.AST) -> bool:
+    """Whether an expression is ``main()`` with no arguments."""
+    return (isinstance(node, ast.Call) and isinstance(node.func, ast.Name)
+            and node.func.id == "main" and not node.args and not node.keywords)
+
+
+def _guard_mode(guard: ast.If) -> Optional[bool]:
+    """
+    Classify a __main__ guard: True if it is exactly ``sys.exit(main())``,
+    False if exactly ``main()``, None for anything else.
+    """
+    if len(guard.body) != 1 or guard.orelse or not isinstance(guard.body[0], ast.Expr):
+        return None
+    call = guard.body[0].value
+    if _is_main_call(call):
+        return False
+    if (isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute)
+            and isinstance(call.func.value, ast.Name) and call.func.value.id == "sys"
+            and call.func.attr == "exit" and len(call.args) == 1
+            and not call.keywords and _is_main_call(call.args[0])):
+        return True
+    return None
+
+
+@contextmanager
+def _script_context(script: str):
+    """Make sys.path and sys.argv look as they would for ``python script``."""
+    saved_argv = sys.argv
+    sys.argv = [script]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    try:
+        yield
+    finally:
+        sys.path.pop(0)
+        sys.argv = saved_argv
+
+
+@contextmanager
+def _isolated_modules():
+    """
+    Let a validation script import the project afresh, as a new interpreter
+    would: project modules this process already loaded (the ones a task may
+    have just patched) are hidden while it runs, and sys.modules is put back
+    as it was afterwards.
+    """
+    saved = dict(sys.modules)
+    root = os.path.join(os.getcwd(), "")
+    for name, module in saved.items():
+        path = getattr(module, "__file__", None)
+        if (name != "__main__" and path and "site-packages" not in path
+                and os.path.abspath(path).startswith(root)):
+            del sys.modules[name]
+    importlib.invalidate_caches()
+    try:
+        yield
+    finally:
+        for name in set(sys.modules) - saved.keys():
+            del sys.modules[name]
+        sys.modules.update(saved)
+
+
+def _validation_mode(script: str) -> Optional[bool]:
+    """
+    Decide whether a validation script can run in-process.
+    Returns None unless the script defines main() and its __main__ guard
+    does nothing but call it; otherwise whether the guard exits with
+    main()'s return value (see _guard_mode).
+    """
+    key = (os.path.abspath(script), os.stat(script).st_mtime_ns)
+    if key in _validation_cache:
+        return _validation_cache[key]
+
+    with open(script, "rb") as f:
+        tree = ast.parse(f.read(), filename=script)
+    has_main = any(isinstance(node, ast.FunctionDef) and node.name == "main"
+                   for node in tree.body)
+    guards = [node for node in tree.body if _is_main_guard(node)]
+    mode = _guard_mode(guards[0]) if has_main and len(guards) == 1 else None
+
+    _validation_cache[key] = mode
+    return mode
+
+
+def _run_validation_main(script: str, exits_with_result: bool) -> Tuple[int, str]:
+    """
+    Import a validation script afresh and call its main(), as its __main__
+    guard would. Returns (exit code, stderr text).
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr), \
+                _script_context(script), _isolated_modules():
+            spec = importlib.util.spec_from_file_location("_validation_script", script)
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            result = module.main()
+        # A bare main() call ignores the return value
+        code = result if exits_with_result else None
+    except SystemExit as e:
+        code = e.code
+    except Exception:
+        traceback.print_exc(file=stderr)
+        code = 1
+
+    # Map the result the way the interpreter maps a script's exit status
+    if code is None:
+        return 0, stderr.getvalue()
+    if isinstance(code, int):
+        return code, stderr.getvalue()
+    return 1, stderr.getvalue() + f"{code}\n"
 
 
 class TaskResult:
+    __slots__ = ("success", "error_message")
+
     def __init__(self, success: bool, error_message: str = ""):
         self.success = success
         self.error_message = error_message
 
 
+@dataclass
+class PlanEntry:
+    """A checklist task, flattened to the fields execute_checklist needs."""
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10;
+    # slotted fields can't carry defaults, so _build_plan passes every field
+    __slots__ = ("phase_name", "description", "command", "validation_script",
+                 "blockers", "depends_on", "capture_output")
+    phase_name: str
+    description: str
+    command: Optional[str]
+    validation_script: Optional[str]
+    blockers: List[Dict[str, Any]]
+    depends_on: List[str]
+    capture_output: bool
+
+
+@dataclass
+class PlanPhase:
+    """A checklist phase with its precomputed task entries."""
+    name: str
+    success_gate: Optional[Dict[str, Any]]
+    tasks: List[PlanEntry]
+    gate_fn: Optional[Callable[[Dict[str, Any]], bool]] = None
+    # Tasks run one at a time in listed order unless the phase opts in
+    parallel: bool = False
+
+
 class Orchestrator:
     def __init__(self, checklist_dir: str = ".checklists", patches_dir: str = ".patches"):
         self.checklist_dir = Path(checklist_dir)
         self.patches_dir = Path(patches_dir)
         self.patches_dir.mkdir(exist_ok=True)
         self.current_checklist = None
+        self._plan: List[PlanPhase] = []
         self.status = {}
         self.results = {}
         self.validator = TransitionValidator("transition_artifacts")
         self.file_ops = FileOperations()
         self.lmstudio_client = LMStudioClient()
-        self.blocker_resolver = BlockerResolver()
+        # Share one LMStudio session between direct prompts and blocker checks
+        self.blocker_resolver = BlockerResolver(
+            self.lmstudio_client, cache_path=str(LLM_CACHE_PATH))
+        # Resolved once per loaded checklist; None until one is loaded
+        self._status_path: Optional[Path] = None
+        self._journal_path: Optional[Path] = None
+        self._status_tmp_path: Optional[Path] = None
+        self._pending_events: List[bytes] = []
+        self._journal_events = 0
+        self._snapshot_due = False
+        # xxh3 of the snapshot bytes last read or written, to skip identical rewrites
+        self._last_status_hash = 0
+        self._status_lock = threading.Lock()
+        self._flush_stop = threading.Event()
+        self._flush_thread = None
+        self._flush_start_lock = threading.Lock()
 
     def load_checklist(self, checklist_name: str) -> None:
         """Load a checklist from the checklist directory."""
+        if self.current_checklist:
+            # Don't let queued events for the previous checklist land in the new journal
+            self.flush_status()
         self.checklist_name = checklist_name  # Store the checklist name
         checklist_path = self.checklist_dir / f"{checklist_name}.json"
         if not checklist_path.exists():
             raise FileNotFoundError(f"Checklist {checklist_name} not found")
 
-        with open(checklist_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-            
-        if "checklist" not in data:
-            raise ValueError("Invalid checklist format: missing 'checklist' key")
-        
+        data = self._read_checklist(checklist_path)
         checklist = data["checklist"]
-        if "phases" not in checklist:
-            raise ValueError("Invalid checklist format: missing 'phases' key")
-        
+
         self.current_checklist = data
+        self._plan = self._build_plan(checklist)
         
-        # Try to load existing status
-        status_path = Path(f"{checklist_name}_status.json")
+        # Try to load existing status: the last snapshot plus the journal since
+        status_path = self._status_path = Path(f"{checklist_name}_status.json")
+        self._journal_path = status_path.with_suffix(".jsonl")
+        self._status_tmp_path = status_path.with_suffix(".json.tmp")
+        self.status = {}
+        self._last_status_hash = 0
         if status_path.exists():
-            with open(status_path, 'r', encoding='utf-8') as f:
-                self.status = json.load(f)
-        else:
-            # Initialize new status
-            self.status = {
-                phase["name"]: {
-                    "status": "not_started",
-                    "tasks": {
-                        task["description"]: "not_started"
-                        for task in phase.get("tasks", [])
-                    }
-                }
-                for phase in checklist["phases"]
-            }
+            raw_status = status_path.read_bytes()
+            self.status = orjson.loads(raw_status)
+            self._last_status_hash = xxhash.xxh3_64_intdigest(raw_status)
+        self._journal_events = self._replay_journal(self._journal_path)
+
+        # Give every phase and task an entry, so later code can index the
+        # status directly even when the file predates checklist edits
+        changed = False
+        for phase in self._plan:
+            phase_status = self.status.get(phase.name)
+            if phase_status is None:
+                phase_status = self.status[phase.name] = {
+                    "status": "not_started", "tasks": {}}
+                changed = True
+            if "status" not in phase_status:
+                phase_status["status"] = "not_started"
+                changed = True
+            task_statuses = phase_status.setdefault("tasks", {})
+            for entry in phase.tasks:
+                if entry.description not in task_statuses:
+                    task_statuses[entry.description] = "not_started"
+                    changed = True
+        if changed:
             # Save initial status
             self._save_status()
         
         self.results = {}
 
+    def _read_checklist(self, checklist_path: Path) -> Dict[str, Any]:
+        """Parse and validate a checklist, reusing a cached copy while the file is unchanged."""
+        st = checklist_path.stat()
+        stamp = [st.st_mtime_ns, st.st_size]
+        source = str(checklist_path.resolve())
+        cache_path = PLAN_CACHE_DIR / f"{checklist_path.stem}.json"
+
+        try:
+            cached = orjson.loads(cache_path.read_bytes())
+            if cached["source"] == source and cached["stamp"] == stamp:
+                return cached["data"]
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError):
+            # Missing, stale-format or unreadable cache: fall back to parsing
+            pass
+
+        data = orjson.loads(checklist_path.read_bytes())
+
+        if "checklist" not in data:
+            raise ValueError("Invalid checklist format: missing 'checklist' key")
+        
+        checklist = data["checklist"]
+        if "phases" not in checklist:
+            raise ValueError("Invalid checklist format: missing 'phases' key")
+
+        try:
+            PLAN_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_name(cache_path.name + ".tmp")
+            tmp_path.write_bytes(
+                orjson.dumps({"source": source, "stamp": stamp, "data": data}))
+            os.replace(tmp_path, cache_path)
+        except OSError:
+            # Caching is best-effort (e.g. read-only working directory)
+            pass
+
+        return data
+
+    @staticmethod
+    def _build_plan(checklist: Dict[str, Any]) -> List["PlanPhase"]:
+        """Flatten the checklist into the per-phase task entries execute_checklist walks."""
+        plan = []
+        for phase in checklist["phases"]:
+            phase_name = phase["name"]
+            entries = []
+            for task in phase.get("tasks", []):
+                validation = task.get("validation")
+                entries.append(PlanEntry(
+                    phase_name=phase_name,
+                    description=task["description"],
+                    command=task.get("command"),
+                    validation_script=(
+                        validation.get("script", "") if validation is not None else None),
+                    blockers=task.get("blockers", []),
+                    depends_on=task.get("depends_on", []),
+                    capture_output=task.get("capture_output", True)
+                ))
+            gate = phase.get("success_gate")
+            # Resolve the metric's check once; gates without a metric always pass
+            gate_fn = (
+                _GATE_CHECKS.get(gate["metric"], _check_unknown_metric)
+                if gate is not None and "metric" in gate else None)
+            plan.append(PlanPhase(
+                phase_name, gate, entries, gate_fn, phase.get("parallel", False)))
+        return plan
+
+    def _replay_journal(self, journal_path: Path) -> int:
+        """Apply journaled status transitions on top of the loaded snapshot."""
+        try:
+            raw = journal_path.read_bytes()
+        except FileNotFoundError:
+            return 0
+
+        count = 0
+        for line in raw.splitlines():
+            try:
+                event = orjson.loads(line)
+            except orjson.JSONDecodeError:
+                # A torn final line from an interrupted append
+                continue
+            phase_status = self.status.setdefault(event["p"], {})
+            if event["t"] is None:
+                phase_status["status"] = event["s"]
+            else:
+                phase_status.setdefault("tasks", {})[event["t"]] = event["s"]
+            count += 1
+        return count
+
+    def _append_event(self, phase_name: str, task_desc: Optional[str],
+                      new_status: str) -> None:
+        """
+        Set a phase status (task_desc None) or task status, and queue the
+        transition for the status journal.
+        """
+        phase_status = self.status[phase_name]
+        statuses, key = ((phase_status, "status") if task_desc is None
+                         else (phase_status["tasks"], task_desc))
+        if statuses.get(key) == new_status:
+            # Not a transition; journaling it would only add bytes
+            return
+        statuses[key] = new_status
+        if self._status_path is None:
+            return
+
+        record = orjson.dumps({
+            "p": phase_name, "t": task_desc, "s": new_status, "ts": time.time_ns()})
+        with self._status_lock:
+            self._pending_events.append(record + b"\n")
+        self._start_flusher()
+
     def _save_status(self) -> None:
-        """Save the current status to a file."""
-        if not self.current_checklist or not hasattr(self, 'checklist_name'):
+        """Schedule a full status snapshot; a background writer coalesces the saves."""
+        if self._status_path is None:
             return
 
-        status_path = Path(f"{self.checklist_name}_status.json")
-        try:
-            with open(status_path, 'w', encoding='utf-8') as f:
-                json.dump(self.status, f, indent=4)
-        except Exception as e:
-            print(f"Warning: Failed to save status: {e}")
+        self._snapshot_due = True
+        self._start_flusher()
+
+    def _start_flusher(self) -> None:
+        """Start the background status writer on first use."""
+        if self._flush_thread is None:
+            with self._flush_start_lock:
+                if self._flush_thread is None:
+                    self._flush_thread = threading.Thread(
+                        target=self._flush_loop, daemon=True)
+                    self._flush_thread.start()
+                    atexit.register(self.flush_status)
+
+    def _flush_loop(self) -> None:
+        """Periodically persist the status while it keeps changing."""
+        while not self._flush_stop.wait(STATUS_FLUSH_INTERVAL):
+            self.flush_status()
+
+    def close(self) -> None:
+        """
+        Stop the background status writer and persist anything still queued.
+        The writer starts again if the status changes afterwards.
+        """
+        with self._flush_start_lock:
+            thread, self._flush_thread = self._flush_thread, None
+        if thread is not None:
+            self._flush_stop.set()
+            thread.join()
+            self._flush_stop.clear()
+            atexit.unregister(self.flush_status)
+        self.flush_status()
+
+    def flush_status(self) -> None:
+        """
+        Append queued transitions to the status journal, or fold everything
+        into a fresh snapshot once the journal has grown long enough.
+        """
+        with self._status_lock:
+            events, self._pending_events = self._pending_events, []
+            snapshot = self._snapshot_due
+            self._snapshot_due = False
+            if not events and not snapshot:
+                return
+
+            status_path = self._status_path
+            journal_path = self._journal_path
+            journal_events = self._journal_events + len(events)
+            try:
+                if journal_events >= JOURNAL_COMPACT_EVERY:
+                    snapshot = True
+                if not snapshot:
+                    with open(journal_path, "ab") as f:
+                        f.write(b"".join(events))
+                else:
+                    # The in-memory status already reflects every journaled
+                    # event. orjson serializes in one step, so the executing
+                    # thread can't change the dict mid-write
+                    payload = orjson.dumps(self.status)
+                    payload_hash = xxhash.xxh3_64_intdigest(payload)
+                    if payload_hash == self._last_status_hash:
+                        # The snapshot on disk already holds these bytes
+                        pass
+                    elif EPHEMERAL_STATUS:
+                        status_path.write_bytes(payload)
+                    else:
+                        # Swap in a fully written file; no fsync, the OS batches the flush
+                        self._status_tmp_path.write_bytes(payload)
+                        os.replace(self._status_tmp_path, status_path)
+                    self._last_status_hash = payload_hash
+                    if journal_path.exists():
+                        journal_path.unlink()
+                    journal_events = 0
+                self._journal_events = journal_events
+            except Exception as e:
+                self._pending_events[:0] = events
+                self._snapshot_due = self._snapshot_due or snapshot
+                log.warning(f"Warning: Failed to save status: {e}")
+
+    def export_status_pretty(self) -> str:
+        """Return the current status as indented JSON for human inspection."""
+        return orjson.dumps(self.status, option=orjson.OPT_INDENT_2).decode("utf-8")
 
     def execute_checklist(self) -> int:
         """Execute all phases and tasks in the checklist."""
+        try:
+            return asyncio.run(self._execute_checklist_async())
+        finally:
+            self.close()
+
+    async def _execute_checklist_async(self) -> int:
+        """Execute the checklist, overlapping the subprocesses of independent tasks."""
         if not self.current_checklist:
-            print("No checklist loaded")
+            log.error("No checklist loaded")
             return 1
 
         try:
-            phases = self.current_checklist["checklist"]["phases"]
-            for phase in phases:
-                phase_name = phase["name"]
-                print(f"\nExecuting phase: {phase_name}")
+            limit = asyncio.Semaphore(min(32, (os.cpu_count() or 1) * 4))
+            for phase in self._plan:
+                phase_name = phase.name
+                log.info(f"\nExecuting phase: {phase_name}")
 
                 # Update phase status
-                if phase_name not in self.status:
-                    self.status[phase_name] = {
-                        "status": "not_started", "tasks": {}}
-                self.status[phase_name]["status"] = "in_progress"
-                self._save_status()
-
-                for task in phase.get("tasks", []):
-                    task_desc = task["description"]
-                    print(f"\nTask: {task_desc}")
-
-                    # Update task status
-                    if "tasks" not in self.status[phase_name]:
-                        self.status[phase_name]["tasks"] = {}
-                    self.status[phase_name]["tasks"][task_desc] = "in_progress"
-                    self._save_status()
-
-                    # Check for blockers
-                    blockers = task.get("blockers", [])
-                    if blockers:
-                        print("Checking blockers...")
-                        unresolved = self.blocker_resolver.resolve_blockers(
-                            blockers)
-                        if unresolved:
-                            print("Task blocked by:")
-                            for blocker in unresolved:
-                                print(f"- {blocker['type']}")
-                                if "resolution" in blocker["resolution"]:
-                                    if "required_experts" in blocker["resolution"]:
-                                        experts = blocker["resolution"]["required_experts"]
-                                        print(
-                                            f"  Required experts: {', '.join(experts)}")
-                                    if "diagnostics" in blocker["resolution"]:
-                                        print(
-                                            f"  Run diagnostics: {blocker['resolution']['diagnostics']}")
-                            self.status[phase_name]["tasks"][task_desc] = "blocked"
-                            self._save_status()
-                            continue
-                        print("All blockers resolved")
-
-                    # Execute the task
-                    if "command" in task:
-                        print(f"Executing: {task['command']}")
-                        try:
-                            result = subprocess.run(
-                                task["command"],
-                                shell=True,
-                                capture_output=True,
-                                text=True
-                            )
-                            if result.returncode != 0:
-                                print(
-                                    f"Task failed with error:\n{result.stderr}")
-                                self.status[phase_name]["tasks"][task_desc] = "failed"
-                                self._save_status()
-                                return 1
-                            print(f"Output:\n{result.stdout}")
-                        except Exception as e:
-                            print(f"Error executing task: {str(e)}")
-                            self.status[phase_name]["tasks"][task_desc] = "failed"
-                            self._save_status()
-                            return 1
-
-                    # Run validation if present
-                    if "validation" in task:
-                        print("Running validation...")
-                        try:
-                            script = task["validation"]["script"]
-                            validation_result = subprocess.run(
-                                ["python", script],
-                                capture_output=True,
-                                text=True
-                            )
-                            if validation_result.returncode != 0:
-                                print(
-                                    f"Validation failed:\n{validation_result.stderr}")
-                                self.status[phase_name]["tasks"][task_desc] = "failed"
-                                self._save_status()
-                                return 1
-                            print("Validation passed")
-                        except Exception as e:
-                            print(f"Error during validation: {str(e)}")
-                            self.status[phase_name]["tasks"][task_desc] = "failed"
-                            self._save_status()
-                            return 1
-
-                    self.status[phase_name]["tasks"][task_desc] = "completed"
-                    self._save_status()
+                self._append_event(phase_name, None, "in_progress")
+
+                if not await self._run_phase_tasks(limit, phase):
+                    return 1
 
                 # Check phase success gate if present
-                if "success_gate" in phase:
-                    print(f"\nChecking success gate for phase {phase_name}...")
-                    gate = phase["success_gate"]
-                    if not self._check_success_gate(gate):
-                        print("Phase failed to meet success gate criteria")
-                        self.status[phase_name]["status"] = "failed"
-                        self._save_status()
+                if phase.success_gate is not None:
+                    log.info(f"\nChecking success gate for phase {phase_name}...")
+                    if not self._check_success_gate(phase):
+                        log.error("Phase failed to meet success gate criteria")
+                        self._append_event(phase_name, None, "failed")
                         return 1
-                    print("Success gate passed")
+                    log.info("Success gate passed")
 
-                self.status[phase_name]["status"] = "completed"
-                self._save_status()
+                self._append_event(phase_name, None, "completed")
+                _log_handler.flush()
 
-            print("\nChecklist execution completed successfully")
+            log.info("\nChecklist execution completed successfully")
             return 0
 
         except Exception as e:
-            print(f"Error executing checklist: {str(e)}")
+            log.error(f"Error executing checklist: {str(e)}")
             return 1
 
-    def _check_success_gate(self, gate: dict) -> bool:
-        """Check if a phase's success gate criteria are met."""
-        try:
-            if "metric" not in gate:
-                return True
-
-            metric = gate["metric"]
-            min_value = gate.get("min_value", 0)
-
-            if metric == "integration_test_coverage":
-                # TODO: Implement coverage check
-                return True
-
-            if metric == "api_test_coverage":
-                # TODO: Implement API coverage check
-                return True
-
-            if metric == "validation_coverage":
-                # TODO: Implement validation coverage check
-                return True
+        finally:
+            self.flush_status()
+            _log_handler.flush()
+
+    async def _run_phase_tasks(self, limit: asyncio.Semaphore, phase: "PlanPhase") -> bool:
+        """
+        Run a phase's tasks in an order that respects depends_on: one at a
+        time in listed order, or, for phases marked parallel, in concurrent
+        waves of tasks whose dependencies are settled.
+        Returns False if any task failed.
+        """
+        task_statuses = self.status[phase.name]["tasks"]
+        in_phase = {entry.description for entry in phase.tasks}
+        # Tasks of earlier phases, which are settled by now
+        earlier = {}
+        for other in self._plan:
+            if other is phase:
+                break
+            for desc, status in self.status[other.name]["tasks"].items():
+                if earlier.get(desc) != "completed":
+                    earlier[desc] = status
+
+        # Names matching no task here or in an earlier phase can never settle
+        unknown = False
+        for entry in phase.tasks:
+            missing = [dep for dep in entry.depends_on
+                       if dep not in in_phase and dep not in earlier]
+            if missing:
+                log.error(f"Unknown dependencies of task {entry.description}: "
+                          f"{', '.join(missing)}")
+                self._append_event(phase.name, entry.description, "failed")
+                unknown = True
+        if unknown:
+            return False
 
+        def dep_status(dep: str) -> str:
+            """Status of a dependency, in this phase or an earlier one."""
+            return task_statuses[dep] if dep in in_phase else earlier[dep]
+
+        pending = list(phase.tasks)
+        done = set()
+
+        while pending:
+            # Dependencies outside this phase were settled by earlier phases
+            ready = [
+                entry for entry in pending
+                if all(dep in done or dep not in in_phase for dep in entry.depends_on)
+            ]
+            if not ready:
+                log.error(f"Unresolvable task dependencies in phase {phase.name}")
+                for entry in pending:
+                    self._append_event(phase.name, entry.description, "failed")
+                return False
+            if not phase.parallel:
+                # The first task in listed order whose dependencies are settled
+                ready = ready[:1]
+
+            runnable = []
+            for entry in ready:
+                if any(dep_status(dep) != "completed" for dep in entry.depends_on):
+                    log.info(f"\nTask: {entry.description}\nBlocked by an unfinished dependency")
+                    self._append_event(phase.name, entry.description, "blocked")
+                    continue
+                runnable.append(entry)
+
+            # A task running alone may validate in-process; with company, the
+            # redirected sys.stdout/sys.stderr would capture the others' output
+            exclusive = len(runnable) == 1
+            results = await asyncio.gather(
+                *(self._run_task(limit, entry, exclusive) for entry in runnable))
+
+            done.update(entry.description for entry in ready)
+            pending = [entry for entry in pending if entry.description not in done]
+            if not all(result.success for result in results):
+                return False
+
+        return True
+
+    @staticmethod
+    async def _spawn(command: str, stdout: Any = _PIPE,
+                     stderr: Any = _PIPE) -> asyncio.subprocess.Process:
+        """Start a task command, going through a shell only when it needs one."""
+        argv = None
+        if not _SHELL_METACHARS.search(command):
+            try:
+                argv = shlex.split(command)
+            except ValueError:
+                pass
+        if argv:
+            try:
+                return await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=stdout,
+                    stderr=stderr
+                )
+            except OSError:
+                # Not runnable directly, e.g. a shell builtin or a
+                # VAR=value prefix
+                pass
+        return await asyncio.create_subprocess_shell(
+            command,
+            stdout=stdout,
+            stderr=stderr
+        )
+
+    @staticmethod
+    def _task_log_path(entry: "PlanEntry") -> Path:
+        """Location of the output log for a task's command."""
+        return (TASK_LOG_DIR / _UNSAFE_PATH_CHARS.sub("_", entry.phase_name)
+                / f"{_UNSAFE_PATH_CHARS.sub('_', entry.description)}.log")
+
+    async def _run_task(self, limit: asyncio.Semaphore, entry: "PlanEntry",
+                        exclusive: bool = False) -> TaskResult:
+        """
+        Check blockers, run the command and validation for one task, and record its status.
+        Pass exclusive=True only when no other task runs at the same time;
+        the validation script may then run in this process.
+        """
+        task_desc = entry.description
+        # Collected and printed in one go so concurrent tasks don't interleave
+        output = [f"\nTask: {task_desc}"]
+
+        def finish(status: str, result: TaskResult) -> TaskResult:
+            self._append_event(entry.phase_name, task_desc, status)
+            log.info("\n".join(output))
+            return result
+
+        async with limit:
+            # Update task status
+            self._append_event(entry.phase_name, task_desc, "in_progress")
+
+            # Check for blockers
+            blockers = entry.blockers
+            if blockers:
+                output.append("Checking blockers...")
+                # The resolver blocks on subprocesses and HTTP, so keep it off the loop
+                unresolved = await asyncio.get_running_loop().run_in_executor(
+                    None, self.blocker_resolver.resolve_blockers, blockers)
+                if unresolved:
+                    output.append("Task blocked by:")
+                    for blocker in unresolved:
+                        output.append(f"- {blocker['type']}")
+                        if "resolution" in blocker["resolution"]:
+                            if "required_experts" in blocker["resolution"]:
+                                experts = blocker["resolution"]["required_experts"]
+                                output.append(
+                                    f"  Required experts: {', '.join(experts)}")
+                            if "diagnostics" in blocker["resolution"]:
+                                output.append(
+                                    f"  Run diagnostics: {blocker['resolution']['diagnostics']}")
+                    return finish("blocked", TaskResult(True, "Task blocked"))
+                output.append("All blockers resolved")
+
+            # Execute the task
+            if entry.command is not None:
+                output.append(f"Executing: {entry.command}")
+                try:
+                    # The child writes straight into the task log, so output
+                    # is never buffered in this process
+                    log_path = self._task_log_path(entry)
+                    log_path.parent.mkdir(parents=True, exist_ok=True)
+                    with open(log_path, "wb", buffering=0) as log_file:
+                        proc = await self._spawn(
+                            entry.command,
+                            stdout=log_file if entry.capture_output else _DEVNULL,
+                            stderr=log_file)
+                        await proc.wait()
+                    self.results.setdefault(entry.phase_name, {})[task_desc] = {
+                        "log": str(log_path)}
+                    if proc.returncode != 0:
+                        error = _read_tail(log_path)
+                        output.append(f"Task failed with error:\n{error}")
+                        return finish("failed", TaskResult(False, error))
+                    output.append(f"Output written to {log_path}")
+                except Exception as e:
+                    output.append(f"Error executing task: {str(e)}")
+                    return finish("failed", TaskResult(False, str(e)))
+
+            # Run validation if present
+            if entry.validation_script is not None:
+                output.append("Running validation...")
+                try:
+                    mode = (_validation_mode(entry.validation_script)
+                            if exclusive else None)
+                    if mode is not None:
+                        # Skip interpreter start-up for scripts exposing main(),
+                        # calling it off the loop so it stays responsive
+                        returncode, error = await asyncio.get_running_loop().run_in_executor(
+                            None, _run_validation_main, entry.validation_script, mode)
+                    else:
+                        proc = await asyncio.create_subprocess_exec(
+                            "python", entry.validation_script,
+                            stdout=_DEVNULL,
+                            stderr=_PIPE
+                        )
+                        _, stderr = await proc.communicate()
+                        returncode = proc.returncode
+                        error = stderr.decode(errors="replace")
+                    if returncode != 0:
+                        output.append(f"Validation failed:\n{error}")
+                        return finish("failed", TaskResult(False, error))
+                    output.append("Validation passed")
+                except Exception as e:
+                    output.append(f"Error during validation: {str(e)}")
+                    return finish("failed", TaskResult(False, str(e)))
+
+            return finish("completed", TaskResult(True))
+
+    def _check_success_gate(self, phase: "PlanPhase") -> bool:
+        """Check if a phase's success gate criteria are met."""
+        if phase.gate_fn is None:
             return True
-
+        try:
+            return phase.gate_fn(phase.success_gate)
         except Exception as e:
-            print(f"Error checking success gate: {str(e)}")
+            log.error(f"Error checking success gate: {str(e)}")
             return False
 
     def display_status(self) -> str:
@@ -234,48 +832,35 @@ class Orchestrator:
         if not self.current_checklist:
             return "No checklist loaded"
 
-        output = []
-        output.append(
-            f"📋 Checklist: {self.current_checklist['checklist']['name']}")
-        output.append("=" * 50)
-        output.append("")
+        buf = io.StringIO()
+        buf.write(_CHECKLIST_HEADER_TPL.format_map(
+            {"name": self.current_checklist['checklist']['name']}))
+        buf.write(_DIVIDER)
+        buf.write("\n\n")
 
-        for phase in self.current_checklist["checklist"]["phases"]:
-            phase_name = phase["name"]
-            phase_status = self.status.get(
-                phase_name, {}).get("status", "not_started")
-            status_emoji = {
-                "not_started": "⚪",
-                "in_progress": "🔄",
-                "completed": "✅",
-                "failed": "❌",
-                "blocked": "⛔"
-            }.get(phase_status, "❓")
-
-            output.append(
-                f"{status_emoji} Phase: {phase_name} [{phase_status}]")
-
-            if "success_gate" in phase:
-                gate = phase["success_gate"]
-                output.append(
-                    f"   🎯 Success Gate: {gate['metric']} (min: {gate['min_value']})")
+        for phase in self._plan:
+            phase_statuses = self.status[phase.name]
+            phase_status = phase_statuses["status"]
+            buf.write(_PHASE_HEADER_TPL.format_map({
+                "emoji": STATUS_EMOJI.get(phase_status, "❓"),
+                "name": phase.name,
+                "status": phase_status}))
 
-            for task in phase.get("tasks", []):
-                task_desc = task["description"]
-                task_status = self.status.get(phase_name, {}).get(
-                    "tasks", {}).get(task_desc, "not_started")
-                task_emoji = {
-                    "not_started": "⚪",
-                    "in_progress": "🔄",
-                    "completed": "✅",
-                    "failed": "❌",
-                    "blocked": "⛔"
-                }.get(task_status, "❓")
-                output.append(f"   {task_emoji} {task_desc} [{task_status}]")
+            if phase.success_gate is not None:
+                buf.write(_GATE_LINE_TPL.format_map(phase.success_gate))
+
+            task_statuses = phase_statuses["tasks"]
+            for entry in phase.tasks:
+                task_status = task_statuses[entry.description]
+                buf.write(_TASK_LINE_TPL.format_map({
+                    "emoji": STATUS_EMOJI.get(task_status, "❓"),
+                    "desc": entry.description,
+                    "status": task_status}))
 
-            output.append("")
+            buf.write("\n")
 
-        return "\n".join(output)
+        # The joined form had no newline after the last (blank) line
+        return buf.getvalue()[:-1]
 
 
 def main():
@@ -285,14 +870,20 @@ def main():
                         help="Name of the checklist to execute")
     parser.add_argument("--status", action="store_true",
                         help="Display checklist status")
+    parser.add_argument("--status-json", action="store_true",
+                        help="Print checklist status as indented JSON")
     args = parser.parse_args()
 
     orchestrator = Orchestrator()
     try:
         orchestrator.load_checklist(args.checklist)
-        if args.status:
+        if args.status_json:
+            print(orchestrator.export_status_pretty())
+        elif args.status:
             print(orchestrator.display_status())
         else:
+            if uvloop is not None:
+                asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
             return orchestrator.execute_checklist()
     except Exception as e:
         print(f"Error: {str(e)}")
@@ -5,6 +5,7 @@ import os
 from unittest.mock import patch, MagicMock
 from cursor_ai.core import (
     CursorAIClient,
+    get_client,
     AIServiceType,
     AIRequestType,
     AIRequest,
@@ -47,6 +48,15 @@ def test_client_initialization(client):
     assert client.default_service == AIServiceType.CURSOR
 
 
+def test_get_client_returns_shared_instance(tmp_path):
+    """Test that get_client reuses the client for the same config directory."""
+    config_dir = str(tmp_path / ".cursor_ai")
+    get_client.cache_clear()
+
+    assert get_client(config_dir) is get_client(config_dir)
+    assert get_client(config_dir) is not get_client(str(tmp_path / "other"))
+
+
 def test_save_service_config(client):
     """Test saving service configuration."""
     config = {
@@ -75,13 +85,13 @@ def test_validate_code_no_api_key():
         assert response.confidence == 0.0
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_validate_code_success(mock_post, client, sample_code, mock_response):
     """Test successful code validation."""
     # Set up mock
     mock_post.return_value = MagicMock(
         status_code=200,
-        json=lambda: mock_response
+        content=json.dumps(mock_response).encode()
     )
 
     response = client.validate_code(sample_code)
@@ -96,15 +106,15 @@ def test_validate_code_success(mock_post, client, sample_code, mock_response):
     mock_post.assert_called_once()
     call_args = mock_post.call_args
     assert call_args[0][0].endswith("/validation")
-    assert call_args[1]["headers"]["Authorization"] == "Bearer test_key"
+    assert client._session.headers["Authorization"] == "Bearer test_key"
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_review_code(mock_post, client, sample_code, mock_response):
     """Test code review functionality."""
     mock_post.return_value = MagicMock(
         status_code=200,
-        json=lambda: mock_response
+        content=json.dumps(mock_response).encode()
     )
 
     response = client.review_code(sample_code)
@@ -116,12 +126,12 @@ def test_review_code(mock_post, client, sample_code, mock_response):
     assert mock_post.call_args[0][0].endswith("/code_review")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_get_suggestions(mock_post, client, mock_response):
     """Test getting suggestions."""
     mock_post.return_value = MagicMock(
         status_code=200,
-        json=lambda: mock_response
+        content=json.dumps(mock_response).encode()
     )
 
     response = client.get_suggestions("How to improve this code?")
@@ -133,12 +143,12 @@ def test_get_suggestions(mock_post, client, mock_response):
     assert mock_post.call_args[0][0].endswith("/suggestion")
 
 
-@patch("requests.post")
+@patch("requests.Session.post")
 def test_generate_documentation(mock_post, client, sample_code, mock_response):
     """Test documentation generation."""
     mock_post.return_value = MagicMock(
         status_code=200,
-        json=lambda: mock_response
+        content=json.dumps(mock_response).encode()
     )
 
     response = client.generate_documentation(sample_code)
@@ -174,7 +184,7 @@ def test_context_caching(client, tmp_path):
 
 def test_error_handling(client):
     """Test error handling in requests."""
-    with patch("requests.post") as mock_post:
+    with patch("requests.Session.post") as mock_post:
         # Simulate network error
         mock_post.side_effect = Exception("Network error")
 
@@ -0,0 +1,87 @@
+import orjson
+import pytest
+
+import orchestrator
+from orchestrator import Orchestrator
+
+
+@pytest.fixture
+def journal_checklist(tmp_path, monkeypatch):
+    """Create a small checklist with a dependency and an in-process validation."""
+    monkeypatch.chdir(tmp_path)
+    checklist_dir = tmp_path / ".checklists"
+    checklist_dir.mkdir()
+
+    checklist = {
+        "checklist": {
+            "name": "Journal Checklist",
+            "phases": [
+                {
+                    "name": "Phase 1",
+                    "tasks": [
+                        {"description": "Task 1", "command": "echo one"},
+                        {
+                            "description": "Task 2",
+                            "command": "echo two",
+                            "depends_on": ["Task 1"],
+                            "validation": {"script": "validate_journal.py"}
+                        }
+                    ]
+                }
+            ]
+        }
+    }
+    (checklist_dir / "journal.json").write_bytes(orjson.dumps(checklist))
+    (tmp_path / "validate_journal.py").write_text(
+        "import sys\n"
+        "\n"
+        "def main():\n"
+        "    print('{\"success\": true}')\n"
+        "    return 0\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    sys.exit(main())\n")
+    return tmp_path
+
+
+def _run(name="journal"):
+    """Load and execute a checklist with a fresh orchestrator."""
+    orc = Orchestrator()
+    orc.load_checklist(name)
+    return orc, orc.execute_checklist()
+
+
+def test_execute_checklist_journals_and_reloads(journal_checklist):
+    """Test that status transitions are journaled and replayed on reload."""
+    orc, code = _run()
+    assert code == 0
+    assert orc._flush_thread is None
+    assert (journal_checklist / "journal_status.json").exists()
+
+    # The status file now covers every task, so a rerun only appends its
+    # transitions to the journal
+    _, code = _run()
+    assert code == 0
+    events = [orjson.loads(line) for line in
+              (journal_checklist / "journal_status.jsonl").read_bytes().splitlines()]
+    assert {"p": "Phase 1", "t": "Task 2", "s": "completed"}.items() <= events[-2].items()
+    assert {"p": "Phase 1", "t": None, "s": "completed"}.items() <= events[-1].items()
+
+    reloaded = Orchestrator()
+    reloaded.load_checklist("journal")
+    assert reloaded.status["Phase 1"] == {
+        "status": "completed",
+        "tasks": {"Task 1": "completed", "Task 2": "completed"}
+    }
+
+
+def test_journal_compaction(journal_checklist, monkeypatch):
+    """Test that a long journal is folded into the status snapshot."""
+    _run()
+    monkeypatch.setattr(orchestrator, "JOURNAL_COMPACT_EVERY", 1)
+    _, code = _run()
+
+    assert code == 0
+    assert not (journal_checklist / "journal_status.jsonl").exists()
+    snapshot = orjson.loads((journal_checklist / "journal_status.json").read_bytes())
+    assert snapshot["Phase 1"]["status"] == "completed"
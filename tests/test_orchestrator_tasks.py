@@ -0,0 +1,181 @@
+import importlib
+import sys
+
+import orjson
+import pytest
+
+from orchestrator import Orchestrator
+
+
+@pytest.fixture
+def run_checklist(tmp_path, monkeypatch):
+    """Return a function that writes a one-phase checklist, executes it and returns the orchestrator."""
+    monkeypatch.chdir(tmp_path)
+    checklist_dir = tmp_path / ".checklists"
+    checklist_dir.mkdir()
+
+    def run(tasks, **phase_options):
+        checklist = {
+            "checklist": {
+                "name": "Task Checklist",
+                "phases": [dict(name="Phase 1", tasks=tasks, **phase_options)]
+            }
+        }
+        (checklist_dir / "tasks.json").write_bytes(orjson.dumps(checklist))
+        orc = Orchestrator()
+        orc.load_checklist("tasks")
+        orc.exit_code = orc.execute_checklist()
+        return orc
+
+    return run
+
+
+def test_shell_builtin_commands(run_checklist):
+    """Test that builtins and VAR=value prefixes run through the shell fallback."""
+    orc = run_checklist([
+        {"description": "Builtin", "command": "exit 0"},
+        {"description": "Env prefix", "command": "FOO=1 true"}
+    ])
+
+    assert orc.exit_code == 0
+    assert orc.status["Phase 1"]["tasks"] == {
+        "Builtin": "completed", "Env prefix": "completed"}
+
+
+def test_failing_builtin_command(run_checklist):
+    """Test that a builtin's non-zero exit status fails the task."""
+    orc = run_checklist([{"description": "Failure", "command": "exit 1"}])
+
+    assert orc.exit_code == 1
+    assert orc.status["Phase 1"]["tasks"]["Failure"] == "failed"
+
+
+def test_in_process_validation_ignores_bare_main_result(run_checklist, tmp_path):
+    """Test that a guard calling main() without sys.exit passes whatever main() returns."""
+    (tmp_path / "validate_dict.py").write_text(
+        "def main():\n"
+        "    return {'status': 'success'}\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    main()\n")
+    orc = run_checklist([{"description": "Dict result",
+                          "validation": {"script": "validate_dict.py"}}])
+
+    assert orc.exit_code == 0
+    assert orc.status["Phase 1"]["tasks"]["Dict result"] == "completed"
+
+
+def test_in_process_validation_sees_patched_modules(run_checklist, tmp_path, monkeypatch):
+    """Test that in-process validation imports project modules afresh after a task patches them."""
+    (tmp_path / "helper_mod.py").write_text("OK = True\n")
+    (tmp_path / "patch_helper.py").write_text(
+        "with open('helper_mod.py', 'w') as f:\n"
+        "    f.write('OK = False  # patched\\n')\n")
+    (tmp_path / "validate_helper.py").write_text(
+        "import sys\n"
+        "import helper_mod\n"
+        "\n"
+        "def main():\n"
+        "    return 0 if helper_mod.OK else 1\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    sys.exit(main())\n")
+    # Loaded here beforehand, as the orchestrator's own modules would be
+    monkeypatch.syspath_prepend(str(tmp_path))
+    importlib.import_module("helper_mod")
+    try:
+        orc = run_checklist([
+            {"description": "Before patch",
+             "validation": {"script": "validate_helper.py"}},
+            {"description": "After patch", "command": f"{sys.executable} patch_helper.py",
+             "depends_on": ["Before patch"],
+             "validation": {"script": "validate_helper.py"}}
+        ])
+    finally:
+        sys.modules.pop("helper_mod", None)
+
+    assert orc.status["Phase 1"]["tasks"] == {
+        "Before patch": "completed", "After patch": "failed"}
+
+
+def _order(tmp_path):
+    """Task names in the order their commands finished."""
+    return (tmp_path / "order.txt").read_text().split()
+
+
+def test_phase_runs_tasks_in_listed_order(run_checklist, tmp_path):
+    """Test that tasks of a phase not marked parallel run one at a time, in order."""
+    orc = run_checklist([
+        {"description": "Slow", "command": "sleep 0.2; echo slow >> order.txt"},
+        {"description": "Fast", "command": "echo fast >> order.txt"}
+    ])
+
+    assert orc.exit_code == 0
+    assert _order(tmp_path) == ["slow", "fast"]
+
+
+def test_parallel_phase_runs_waves(run_checklist, tmp_path):
+    """Test that a parallel phase overlaps independent tasks but waits for dependencies."""
+    orc = run_checklist([
+        {"description": "Slow", "command": "sleep 0.2; echo slow >> order.txt"},
+        {"description": "After slow", "command": "echo after >> order.txt",
+         "depends_on": ["Slow"]},
+        {"description": "Fast", "command": "echo fast >> order.txt"}
+    ], parallel=True)
+
+    assert orc.exit_code == 0
+    assert _order(tmp_path) == ["fast", "slow", "after"]
+
+
+def test_failed_dependency_stops_phase(run_checklist, tmp_path):
+    """Test that a failed task stops the phase before its dependents run."""
+    orc = run_checklist([
+        {"description": "Failure", "command": "exit 1"},
+        {"description": "Dependent", "command": "echo dependent >> order.txt",
+         "depends_on": ["Failure"]}
+    ], parallel=True)
+
+    assert orc.exit_code == 1
+    assert orc.status["Phase 1"]["tasks"] == {
+        "Failure": "failed", "Dependent": "not_started"}
+    assert not (tmp_path / "order.txt").exists()
+
+
+def test_blocked_dependency_blocks_dependents(run_checklist):
+    """Test that a task depending on a blocked task is blocked too."""
+    orc = run_checklist([
+        {"description": "Needs expert", "command": "true",
+         "blockers": [{"type": "Review",
+                       "resolution": {"required_experts": ["Reviewer"]}}]},
+        {"description": "Dependent", "command": "true", "depends_on": ["Needs expert"]}
+    ])
+
+    assert orc.status["Phase 1"]["tasks"] == {
+        "Needs expert": "blocked", "Dependent": "blocked"}
+
+
+@pytest.mark.parametrize("tasks", [
+    [{"description": "A", "command": "true", "depends_on": ["B"]},
+     {"description": "B", "command": "true", "depends_on": ["A"]}],
+    [{"description": "A", "command": "true", "depends_on": ["Missing"]},
+     {"description": "B", "command": "true"}],
+], ids=["cycle", "unknown"])
+def test_unresolvable_dependencies_fail_phase(run_checklist, tasks):
+    """Test that cyclic or unknown depends_on names fail the phase without running it."""
+    orc = run_checklist(tasks)
+
+    assert orc.exit_code == 1
+    assert orc.status["Phase 1"]["tasks"]["A"] == "failed"
+
+
+def test_plan_cache_is_json_under_artifacts(run_checklist, tmp_path):
+    """Test that the parsed checklist is cached as JSON and pickles beside it are never loaded."""
+    # Unpickling this would create a file
+    (tmp_path / ".checklists" / "tasks.plan.cache").write_bytes(
+        b"cos\nsystem\n(S'touch unpickled'\ntR.")
+    run_checklist([{"description": "Task", "command": "true"}])
+
+    assert not (tmp_path / "unpickled").exists()
+    cached = orjson.loads(
+        (tmp_path / "transition_artifacts" / ".plan_cache" / "tasks.json").read_bytes())
+    assert cached["data"]["checklist"]["name"] == "Task Checklist"
@@ -43,11 +43,11 @@ def test_checklist(tmp_path):
     # Create a validation script
     validation_script = tmp_path / "validate_test.py"
     validation_script.write_text("""
-import json
+import orjson
 with open("test.txt", "w") as f:
     f.write("Test content")
-with open("metrics.json", "w") as f:
-    json.dump({"test_coverage": 85.0}, f)
+with open("metrics.json", "wb") as f:
+    f.write(orjson.dumps({"test_coverage": 85.0}))
 """)
 
     return checklist_dir
@@ -83,9 +83,9 @@ def test_validation_failure(test_checklist, tmp_path):
     # Create a failing validation script
     validation_script = tmp_path / "validate_test.py"
     validation_script.write_text("""
-import json
-with open("metrics.json", "w") as f:
-    json.dump({"test_coverage": 75.0}, f)
+import orjson
+with open("metrics.json", "wb") as f:
+    f.write(orjson.dumps({"test_coverage": 75.0}))
 exit(1)
 """)
 
@@ -1,9 +1,13 @@
+import asyncio
+import multiprocessing
 import pytest
 import os
 import shutil
 from pathlib import Path
-import json
+import orjson
 import time
+from concurrent.futures import ProcessPoolExecutor
+from validation_system import core
 from validation_system.core import TransitionValidator, ValidationStatus, ValidationResult
 
 
@@ -35,15 +39,15 @@ def sample_task():
 def validation_script(tmp_path):
     """Create a sample validation script."""
     script_content = """
-import json
+import orjson
 import sys
 
 # Create test artifacts
 with open("test.txt", "w") as f:
     f.write("Test output")
     
-with open("metrics.json", "w") as f:
-    json.dump({"test_coverage": 85}, f)
+with open("metrics.json", "wb") as f:
+    f.write(orjson.dumps({"test_coverage": 85}))
 
 sys.exit(0)
 """
@@ -78,10 +82,46 @@ def test_validate_task_missing_script(validator, sample_task):
     assert "not found" in result.error_message
 
 
-def test_validate_task_success(validator, sample_task, validation_script, tmp_path):
+def test_validate_tasks_concurrently(validator, sample_task):
+    """Test validating several tasks at once keeps results in task order."""
+    tasks = [{"description": "No validation"}, sample_task]
+    results = asyncio.run(validator.validate_tasks(tasks, "test_phase"))
+
+    assert len(results) == 2
+    assert results[0].status == ValidationStatus.SUCCESS
+    assert results[1].status == ValidationStatus.FAILURE
+
+
+def test_validation_sees_edited_modules(validator, monkeypatch, tmp_path):
+    """Test that a reused worker imports a module edited between validations afresh."""
+    monkeypatch.chdir(tmp_path)
+    # A single worker, so both validations run in the same interpreter
+    pool = ProcessPoolExecutor(
+        max_workers=1, mp_context=multiprocessing.get_context("spawn"))
+    monkeypatch.setattr(core, "_script_pool", pool)
+
+    target = tmp_path / "target_mod.py"
+    target.write_text('STATUS = "success"\n')
+    script = tmp_path / "validate_target.py"
+    script.write_text(
+        "import orjson\n"
+        "import target_mod\n"
+        "print(orjson.dumps({'status': target_mod.STATUS}).decode())\n")
+    task = {"description": "Target", "validation": {"script": str(script)}}
+
+    try:
+        assert validator.validate_task(task, "test_phase").status == ValidationStatus.SUCCESS
+        # The task patches the module under validation
+        target.write_text('STATUS = "failure; patched"\n')
+        assert validator.validate_task(task, "test_phase").status == ValidationStatus.FAILURE
+    finally:
+        pool.shutdown()
+
+
+def test_validate_task_success(validator, sample_task, validation_script, monkeypatch, tmp_path):
     """Test successful task validation."""
     # Create test artifacts in the working directory
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
 
     # Update the task to use the actual script path and remove success gate
     sample_task["validation"]["script"] = str(validation_script)
@@ -96,12 +136,12 @@ def test_validate_task_success(validator, sample_task, validation_script, tmp_pa
 
 def test_validate_task_with_success_gate(validator, sample_task, validation_script, monkeypatch, tmp_path):
     """Test task validation with success gate checking."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     sample_task["validation"]["script"] = str(validation_script)
 
     # Create metrics.json with passing value
     metrics_file = tmp_path / "metrics.json"
-    metrics_file.write_text('{"test_coverage": 85.0}')
+    metrics_file.write_bytes(orjson.dumps({"test_coverage": 85.0}))
 
     # Mock _collect_metrics to return our metrics
     def mock_collect_metrics(self, artifacts_dir):
@@ -115,8 +155,11 @@ def test_validate_task_with_success_gate(validator, sample_task, validation_scri
     assert result.metrics["test_coverage"] == 85.0
 
 
-def test_artifact_collection(validator, tmp_path):
+def test_artifact_collection(validator, monkeypatch, tmp_path):
     """Test artifact collection functionality."""
+    # The validation script writes metrics.json to the working directory
+    monkeypatch.chdir(tmp_path)
+
     # Create test artifacts in the artifacts directory
     task_id = "test_phase/Test Task"
     artifacts_dir = validator.artifacts_dir / task_id
@@ -132,9 +175,9 @@ def test_artifact_collection(validator, tmp_path):
     # Create a task with a validation script
     validation_script = tmp_path / "validate_test.py"
     validation_script.write_text("""
-import json
-with open("metrics.json", "w") as f:
-    json.dump({"execution_time": 1.0}, f)
+import orjson
+with open("metrics.json", "wb") as f:
+    f.write(orjson.dumps({"execution_time": 1.0}))
 exit(0)
 """)
 
@@ -150,7 +193,7 @@ exit(0)
     assert result.status == ValidationStatus.SUCCESS
     assert len(result.artifacts) > 0
     assert "test.txt" in result.artifacts
-    assert "Test content" in result.artifacts["test.txt"]
+    assert "Test content" in result.artifacts["test.txt"].read_text()
 
 
 def test_cleanup_artifacts(validator, tmp_path):
@@ -178,7 +221,7 @@ def test_cleanup_artifacts(validator, tmp_path):
 
 def test_metrics_collection(validator, sample_task, validation_script, monkeypatch, tmp_path):
     """Test metrics collection from artifacts."""
-    os.chdir(tmp_path)
+    monkeypatch.chdir(tmp_path)
     sample_task["validation"]["script"] = str(validation_script)
 
     # Create metrics.json with test metrics
@@ -187,7 +230,7 @@ def test_metrics_collection(validator, sample_task, validation_script, monkeypat
         "execution_time": 1.0,
         "test_coverage": 85.0
     }
-    metrics_file.write_text(json.dumps(test_metrics))
+    metrics_file.write_bytes(orjson.dumps(test_metrics))
 
     # Mock _collect_metrics to return our metrics
     def mock_collect_metrics(self, artifacts_dir):
@@ -1,9 +1,10 @@
 import pytest
 import json
-import os
+import runpy
 import subprocess
 import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 # Import the validation scripts
@@ -11,34 +12,43 @@ import validate_git
 import validate_docs
 
 
-@pytest.fixture
-def setup_validation_scripts(tmp_path):
-    """Copy validation scripts to the test directory."""
-    # Get the absolute paths of the validation scripts
-    base_dir = Path(__file__).parent.parent
-    git_script = base_dir / "validation_system" / "validate_git.py"
-    docs_script = base_dir / "validation_system" / "validate_docs.py"
+def run_script(script_path):
+    """Run a validation script in-process as __main__ and return its exit code."""
+    with pytest.raises(SystemExit) as exc_info:
+        runpy.run_path(str(script_path), run_name="__main__")
+    return exc_info.value.code
+
+
+@pytest.fixture(autouse=True)
+def in_tmp_path(tmp_path, monkeypatch):
+    """Run every test from its own temporary directory."""
+    monkeypatch.chdir(tmp_path)
+
 
-    # Create validation_system directory in tmp_path
-    validation_dir = tmp_path / "validation_system"
-    validation_dir.mkdir(exist_ok=True)
+@pytest.fixture(scope="session")
+def setup_validation_scripts():
+    """Locate the validation scripts; they are run in place, not copied."""
+    return Path(__file__).parent.parent / "validation_system"
 
-    # Copy validation scripts to temp directory
-    shutil.copy2(str(git_script), str(validation_dir / "validate_git.py"))
-    shutil.copy2(str(docs_script), str(validation_dir / "validate_docs.py"))
 
-    return validation_dir
+@pytest.fixture(scope="module")
+def git_repo(tmp_path_factory):
+    """Create a temporary git repository shared by this module's tests."""
+    base = tmp_path_factory.mktemp("repo")
+    subprocess.run(["git", "init", "-q"], cwd=base,
+                   capture_output=True, check=True)
+    # Write the identity straight into the repo config instead of running
+    # `git config` twice more
+    with open(base / ".git" / "config", "a") as f:
+        f.write("[user]\n\tname = Test User\n\temail = test@example.com\n")
+    return base
 
 
 @pytest.fixture
-def git_repo(tmp_path):
-    """Create a temporary git repository."""
-    os.chdir(tmp_path)
-    subprocess.run(["git", "init"], capture_output=True)
-    subprocess.run(["git", "config", "user.name",
-                   "Test User"], capture_output=True)
-    subprocess.run(["git", "config", "user.email",
-                   "test@example.com"], capture_output=True)
+def git_repo_clone(git_repo, tmp_path, monkeypatch):
+    """Copy the shared git repository into tmp_path for tests that modify it."""
+    shutil.copytree(str(git_repo / ".git"), str(tmp_path / ".git"))
+    monkeypatch.chdir(tmp_path)
     return tmp_path
 
 
@@ -141,22 +151,73 @@ def test_git_installation():
     assert validate_git.check_git_installation()
 
 
-def test_git_repository(git_repo):
+def test_git_repository(git_repo, monkeypatch):
     """Test git repository check."""
+    monkeypatch.chdir(git_repo)
     assert validate_git.check_git_repository()
 
     # Test non-git directory
-    os.chdir(git_repo.parent)
+    monkeypatch.chdir(git_repo.parent)
     assert not validate_git.check_git_repository()
 
 
-def test_git_config(git_repo):
+def test_git_config(git_repo, monkeypatch):
     """Test git configuration check."""
+    monkeypatch.chdir(git_repo)
     missing_configs = validate_git.check_git_config()
     assert not missing_configs
 
 
-def test_git_ignore(git_repo, sample_gitignore):
+@pytest.fixture
+def fake_pygit2(monkeypatch):
+    """Stand in for pygit2, with a repository config holding a user identity."""
+    class GitError(Exception):
+        pass
+
+    class Repository:
+        def __init__(self, path):
+            self.config = [
+                SimpleNamespace(name="user.name", value="Test User"),
+                SimpleNamespace(name="user.email", value="test@example.com")
+            ]
+
+    fake = SimpleNamespace(
+        GitError=GitError,
+        Repository=Repository,
+        discover_repository=lambda path: ".git" if Path(".git").is_dir() else None
+    )
+    monkeypatch.setattr(validate_git, "pygit2", fake)
+    return fake
+
+
+@pytest.mark.parametrize("with_pygit2", [True, False])
+def test_git_checks_with_and_without_pygit2(request, git_repo, monkeypatch, with_pygit2):
+    """Test the repository and config checks through pygit2 and through the git CLI."""
+    if with_pygit2:
+        request.getfixturevalue("fake_pygit2")
+    else:
+        monkeypatch.setattr(validate_git, "pygit2", None)
+
+    monkeypatch.chdir(git_repo)
+    assert validate_git.check_git_repository()
+    assert validate_git.check_git_config() == []
+
+    monkeypatch.chdir(git_repo.parent)
+    assert not validate_git.check_git_repository()
+
+
+def test_git_validation_without_git_binary(git_repo_clone, fake_pygit2, monkeypatch, capsys):
+    """Test that a missing git binary is reported, not raised, when pygit2 does the checks."""
+    monkeypatch.setenv("PATH", "")
+
+    assert validate_git.main() == 0
+    data = json.loads(capsys.readouterr().out)
+    assert data["metrics"]["git_configured"]
+    assert any(message.startswith("Error getting git status")
+               for message in data["messages"])
+
+
+def test_git_ignore(git_repo_clone, sample_gitignore):
     """Test .gitignore check."""
     assert validate_git.check_gitignore()
 
@@ -165,24 +226,20 @@ def test_git_ignore(git_repo, sample_gitignore):
     assert not validate_git.check_gitignore()
 
 
-def test_git_validation_script(git_repo, sample_gitignore, setup_validation_scripts):
+def test_git_validation_script(git_repo_clone, sample_gitignore, setup_validation_scripts, capsys):
     """Test the complete git validation script."""
-    # Change to the git repo directory
-    os.chdir(git_repo)
+    git_repo = git_repo_clone
     script_path = setup_validation_scripts / "validate_git.py"
 
     # Ensure the script exists and is executable
     assert script_path.exists(), f"Script not found at {script_path}"
 
-    result = subprocess.run(
-        ["python", str(script_path)],
-        capture_output=True,
-        text=True,
-        cwd=git_repo  # Explicitly set working directory
-    )
+    # git_repo_clone has already changed into the repository
+    returncode = run_script(script_path)
+    result = capsys.readouterr()
 
-    assert result.returncode == 0, f"Script failed with output: {result.stdout}\nError: {result.stderr}"
-    data = json.loads(result.stdout)
+    assert returncode == 0, f"Script failed with output: {result.out}\nError: {result.err}"
+    data = json.loads(result.out)
     assert data["success"]
     assert data["metrics"]["git_configured"]
     assert data["metrics"]["gitignore_score"] > 0
@@ -192,28 +249,21 @@ def test_git_validation_script(git_repo, sample_gitignore, setup_validation_scri
     assert (git_repo / "git_config.txt").exists()
 
 
-def test_readme_check(tmp_path, sample_readme):
-    """Test README.md validation."""
-    os.chdir(tmp_path)
-    exists, missing = validate_docs.check_readme()
-    assert exists
-    assert not missing
-
-
-def test_docs_structure_check(tmp_path, docs_structure):
-    """Test documentation structure validation."""
-    os.chdir(tmp_path)
-    exists, components = validate_docs.check_docs_structure()
+@pytest.mark.parametrize("fixture_name,checker,expected", [
+    ("sample_readme", validate_docs.check_readme, []),
+    ("docs_structure", validate_docs.check_docs_structure,
+     ["api", "tutorials", "examples"]),
+])
+def test_docs_checks(request, fixture_name, checker, expected):
+    """Test the README.md and documentation structure checks."""
+    request.getfixturevalue(fixture_name)
+    exists, items = checker()
     assert exists
-    assert len(components) == 3
-    assert "api" in components
-    assert "tutorials" in components
-    assert "examples" in components
+    assert sorted(items) == sorted(expected)
 
 
-def test_docstring_check(tmp_path, sample_python_files):
+def test_docstring_check(sample_python_files):
     """Test docstring coverage check."""
-    os.chdir(tmp_path)
     metrics = validate_docs.check_docstrings("src")
 
     assert metrics["total_functions"] == 2
@@ -224,10 +274,8 @@ def test_docstring_check(tmp_path, sample_python_files):
     assert metrics["class_coverage"] == 50.0
 
 
-def test_docs_report_generation(tmp_path, sample_readme, docs_structure, sample_python_files):
+def test_docs_report_generation(sample_readme, docs_structure, sample_python_files):
     """Test documentation report generation."""
-    os.chdir(tmp_path)
-
     metrics = validate_docs.check_docstrings("src")
     exists, missing = validate_docs.check_readme()
     structure_exists, components = validate_docs.check_docs_structure()
@@ -240,28 +288,50 @@ def test_docs_report_generation(tmp_path, sample_readme, docs_structure, sample_
     assert "Docstring Coverage" in report
 
 
-def test_docs_validation_script(tmp_path, sample_readme, docs_structure, sample_python_files, setup_validation_scripts):
+def test_docs_readme_score(sample_readme, capsys):
+    """Test that a complete README scores full marks."""
+    validate_docs.main()
+    data = json.loads(capsys.readouterr().out)
+    assert data["metrics"]["readme_score"] == 100.0
+
+
+def test_docs_cache_without_version(tmp_path, setup_validation_scripts, capsys):
+    """Test that per-file metrics from an unversioned cache are recomputed."""
+    source = tmp_path / "tests" / "module.py"
+    source.parent.mkdir()
+    source.write_text('def documented():\n    """Docstring."""\n')
+    st = source.stat()
+    stale = {"total_functions": 1, "documented_functions": 0,
+             "total_classes": 0, "documented_classes": 0,
+             "function_coverage": 0.0, "class_coverage": 100,
+             "overall_coverage": 50.0}
+    (tmp_path / ".docs_cache.json").write_text(json.dumps({
+        str(Path("tests") / "module.py"): [st.st_mtime_ns, st.st_size, stale]
+    }))
+
+    run_script(setup_validation_scripts / "validate_docs.py")
+    capsys.readouterr()
+
+    report = (tmp_path / "docs_report.md").read_text(encoding="utf-8")
+    assert "- Functions: 100.0% (1/1)" in report
+
+
+def test_docs_validation_script(tmp_path, sample_readme, docs_structure, sample_python_files, setup_validation_scripts, capsys):
     """Test the complete documentation validation script."""
-    # Change to the temporary directory
-    os.chdir(tmp_path)
     script_path = setup_validation_scripts / "validate_docs.py"
 
     # Ensure the script exists
     assert script_path.exists(), f"Script not found at {script_path}"
 
-    result = subprocess.run(
-        ["python", str(script_path)],
-        capture_output=True,
-        text=True,
-        cwd=tmp_path  # Explicitly set working directory
-    )
+    run_script(script_path)
+    output = capsys.readouterr().out
 
     # The script may return non-zero if validation fails, but it should still output valid JSON
     try:
-        data = json.loads(result.stdout)
+        data = json.loads(output)
     except json.JSONDecodeError as e:
         pytest.fail(
-            f"Failed to parse JSON output: {e}\nOutput was: {result.stdout}")
+            f"Failed to parse JSON output: {e}\nOutput was: {output}")
 
     assert "metrics" in data
     assert "readme_score" in data["metrics"]
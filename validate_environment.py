@@ -1,8 +1,30 @@
+import re
 import sys
-import pkg_resources
-import subprocess
+from importlib.metadata import distributions
 from pathlib import Path
 
+# Distributions `pip freeze` leaves out unless asked for --all
+_FREEZE_EXCLUDED = {"pip", "setuptools", "wheel", "distribute"}
+
+# Project name at the start of a requirement line, before any version
+# specifier, extras or environment marker
+_REQUIREMENT_NAME = re.compile(rb"\s*([A-Za-z0-9._-]+)")
+
+
+def _normalize(name: str) -> str:
+    """Normalize a project name the way pkg_resources keyed distributions."""
+    return re.sub(r"[^A-Za-z0-9.]+", "-", name).lower()
+
+
+def _installed_distributions():
+    """Map normalized names to (name, version), first match on sys.path winning."""
+    installed = {}
+    for dist in distributions():
+        name = dist.metadata["Name"]
+        if name:
+            installed.setdefault(_normalize(name), (name, dist.version))
+    return installed
+
 
 def validate_environment():
     """Validate the Python environment setup."""
@@ -19,24 +41,33 @@ def validate_environment():
 
     # Read requirements.txt
     try:
-        with open('requirements.txt') as f:
-            required = {line.strip().split(
-                '==')[0] for line in f if line.strip() and not line.startswith('#')}
+        with open('requirements.txt', 'rb') as f:
+            lines = f.read().splitlines()
     except FileNotFoundError:
         print("Error: requirements.txt not found")
         return 1
 
+    # Comments and pip options (-r, -e, --index-url, ...) name no package
+    matches = (_REQUIREMENT_NAME.match(line) for line in lines
+               if line.strip() and not line.lstrip().startswith((b'#', b'-')))
+    required = frozenset(
+        _normalize(match.group(1).decode('ascii')) for match in matches if match)
+
     # Check installed packages
-    installed = {pkg.key for pkg in pkg_resources.working_set}
-    missing = required - installed
+    installed = _installed_distributions()
+    missing = required - installed.keys()
 
     if missing:
-        print(f"Error: Missing required packages: {', '.join(missing)}")
+        print(f"Error: Missing required packages: {', '.join(sorted(missing))}")
         return 1
 
-    # Generate pip freeze artifact
-    subprocess.run([sys.executable, "-m", "pip", "freeze"],
-                   stdout=open("pip_freeze.txt", "w"))
+    # Generate pip freeze artifact from the metadata already loaded, rather
+    # than starting pip in a subprocess
+    with open("pip_freeze.txt", "w") as f:
+        f.writelines(
+            f"{name}=={version}\n"
+            for key, (name, version) in sorted(installed.items())
+            if key not in _FREEZE_EXCLUDED)
 
     print("Python environment validation successful")
     return 0
@@ -3,6 +3,14 @@ import sys
 import json
 import subprocess
 from pathlib import Path
+from typing import List, Optional, Tuple
+
+try:
+    import pygit2
+except ImportError:
+    # Optional: with libgit2 bindings, repository and config queries run
+    # in-process; without them every query runs the git CLI
+    pygit2 = None
 
 
 def check_git_installation():
@@ -16,36 +24,104 @@ def check_git_installation():
 
 def check_git_repository():
     """Check if current directory is a git repository."""
+    if pygit2 is not None:
+        return pygit2.discover_repository(".") is not None
     try:
         subprocess.run(["git", "rev-parse", "--git-dir"],
                        capture_output=True, check=True)
         return True
-    except subprocess.CalledProcessError:
+    except (subprocess.CalledProcessError, FileNotFoundError):
         return False
 
 
-def check_git_config():
-    """Check if git configuration is set up properly."""
+def _read_git_config() -> List[Tuple[str, Optional[str]]]:
+    """
+    Read every git config entry, in `git config --list` order, with one git call.
+    Valueless (implicitly true) entries have a value of None.
+    """
+    if pygit2 is not None:
+        entries = _read_repo_config()
+        if entries is not None:
+            return entries
+
+    result = subprocess.run(
+        ["git", "config", "--list", "-z"],
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    entries = []
+    # NUL-terminated "key\nvalue" records, so values may contain anything
+    for record in result.stdout.split("\0"):
+        if record:
+            key, sep, value = record.partition("\n")
+            entries.append((key, value if sep else None))
+    return entries
+
+
+def _read_repo_config() -> Optional[List[Tuple[str, Optional[str]]]]:
+    """
+    Read the current repository's config entries through libgit2.
+    Returns None outside a repository or if libgit2 can't read the config.
+    """
+    path = pygit2.discover_repository(".")
+    if path is None:
+        return None
+    try:
+        # Iterating the config yields every level's entries, like --list
+        return [(entry.name, entry.value)
+                for entry in pygit2.Repository(path).config]
+    except pygit2.GitError:
+        return None
+
+
+def check_git_config(entries: Optional[List[Tuple[str, Optional[str]]]] = None):
+    """
+    Check if git configuration is set up properly.
+    Pass entries from _read_git_config to reuse a config already read.
+    """
     required_configs = {
         "user.name": "Git username is not set",
         "user.email": "Git email is not set"
     }
 
-    missing_configs = []
-    for config, message in required_configs.items():
+    if entries is None:
         try:
-            result = subprocess.run(
-                ["git", "config", "--get", config],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            if not result.stdout.strip():
-                missing_configs.append(message)
-        except subprocess.CalledProcessError:
-            missing_configs.append(message)
-
-    return missing_configs
+            entries = _read_git_config()
+        except (subprocess.CalledProcessError, FileNotFoundError):
+            entries = []
+    # Later entries override earlier ones, as with `git config --get`
+    values = dict(entries)
+
+    return [message for config, message in required_configs.items()
+            if not (values.get(config) or "").strip()]
+
+
+# Common Python .gitignore entries; having any of them counts as basic coverage
+_BASIC_GITIGNORE_ENTRIES = frozenset({
+    "*.pyc",
+    "__pycache__/",
+    "*.pyo",
+    "*.pyd",
+    ".Python",
+    "env/",
+    "venv/",
+    ".env",
+    ".venv",
+    "pip-log.txt",
+    "pip-delete-this-directory.txt",
+    ".tox/",
+    ".coverage",
+    ".coverage.*",
+    ".cache",
+    "nosetests.xml",
+    "coverage.xml",
+    "*.cover",
+    "*.log",
+    ".pytest_cache/",
+    ".mypy_cache/",
+    ".hypothesis/"
+})
 
 
 def check_gitignore():
@@ -54,40 +130,13 @@ def check_gitignore():
     if not gitignore_path.exists():
         return False
 
-    basic_entries = {
-        "*.pyc",
-        "__pycache__/",
-        "*.pyo",
-        "*.pyd",
-        ".Python",
-        "env/",
-        "venv/",
-        ".env",
-        ".venv",
-        "pip-log.txt",
-        "pip-delete-this-directory.txt",
-        ".tox/",
-        ".coverage",
-        ".coverage.*",
-        ".cache",
-        "nosetests.xml",
-        "coverage.xml",
-        "*.cover",
-        "*.log",
-        ".pytest_cache/",
-        ".mypy_cache/",
-        ".hypothesis/"
-    }
-
-    current_entries = set()
+    # Check for any common entries, stopping at the first one
     with open(gitignore_path) as f:
         for line in f:
             line = line.strip()
-            if line and not line.startswith("#"):
-                current_entries.add(line)
-
-    # Check for any common entries
-    return bool(basic_entries & current_entries)
+            if line and not line.startswith("#") and line in _BASIC_GITIGNORE_ENTRIES:
+                return True
+    return False
 
 
 def main():
@@ -101,23 +150,26 @@ def main():
         }
     }
 
-    # Check git installation
-    if not check_git_installation():
-        validation_results["success"] = False
-        validation_results["messages"].append(
-            "Git is not installed or not accessible")
-        print(json.dumps(validation_results))
-        return 1
-
-    # Check if directory is a git repository
+    # Check if directory is a git repository, and only if it isn't, whether
+    # that's because git itself is missing
     if not check_git_repository():
         validation_results["success"] = False
-        validation_results["messages"].append("Not a git repository")
+        if not check_git_installation():
+            validation_results["messages"].append(
+                "Git is not installed or not accessible")
+        else:
+            validation_results["messages"].append("Not a git repository")
         print(json.dumps(validation_results))
         return 1
 
-    # Check git configuration
-    missing_configs = check_git_config()
+    # Check git configuration, reading it once for the check and the artifact
+    config_error = None
+    try:
+        config_entries = _read_git_config()
+    except (subprocess.CalledProcessError, OSError) as e:
+        # OSError: no git binary, which pygit2 doesn't need for the checks above
+        config_entries, config_error = [], e
+    missing_configs = check_git_config(config_entries)
     if missing_configs:
         validation_results["success"] = False
         validation_results["messages"].extend(missing_configs)
@@ -132,31 +184,27 @@ def main():
     else:
         validation_results["metrics"]["gitignore_score"] = 1.0
 
-    # Generate git status artifact
+    # Generate git status artifact; git writes it straight to the file
     try:
-        status_output = subprocess.run(
-            ["git", "status", "--porcelain"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        with open("git_status.txt", "w") as f:
-            f.write(status_output.stdout)
-    except subprocess.CalledProcessError as e:
+        with open("git_status.txt", "wb") as f:
+            subprocess.run(
+                ["git", "status", "--porcelain"],
+                stdout=f,
+                stderr=subprocess.DEVNULL,
+                check=True
+            )
+    except (subprocess.CalledProcessError, OSError) as e:
         validation_results["messages"].append(f"Error getting git status: {e}")
 
-    # Generate git config artifact
-    try:
-        config_output = subprocess.run(
-            ["git", "config", "--list"],
-            capture_output=True,
-            text=True,
-            check=True
-        )
+    # Generate git config artifact, in `git config --list` format
+    if config_error is None:
         with open("git_config.txt", "w") as f:
-            f.write(config_output.stdout)
-    except subprocess.CalledProcessError as e:
-        validation_results["messages"].append(f"Error getting git config: {e}")
+            f.writelines(
+                f"{key}\n" if value is None else f"{key}={value}\n"
+                for key, value in config_entries)
+    else:
+        validation_results["messages"].append(
+            f"Error getting git config: {config_error}")
 
     print(json.dumps(validation_results))
     return 0 if validation_results["success"] else 1
@@ -1,55 +1,87 @@
+import argparse
 import json
 import os
 from pathlib import Path
 import requests
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson
+
+    def _to_json(data) -> str:
+        """Serialize a result dict for stdout."""
+        return orjson.dumps(data).decode()
+except ImportError:
+    # The script is also run on its own, outside the project environment
+    def _to_json(data) -> str:
+        """Serialize a result dict for stdout."""
+        return json.dumps(data)
 
 from external_ai_integration import LMStudioClient
 
 
-def validate_lmstudio_integration():
-    """Validate the LMStudio integration."""
+# One keep-alive connection shared by every validation run in this process
+_SESSION = requests.Session()
+_SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4))
+_SESSION.headers.update({"Connection": "keep-alive"})
+
+# Stands in for the LMStudio reply on dry runs
+DRY_RUN_RESPONSE = "Dry run: canned LMStudio response"
+
+
+def validate_lmstudio_integration(dry_run: bool = False):
+    """
+    Validate the LMStudio integration.
+    With dry_run (or SO_VALIDATE_DRY_RUN set), skip the API round-trip and
+    check the client against a canned response instead.
+    """
+    dry_run = dry_run or bool(os.getenv("SO_VALIDATE_DRY_RUN"))
+    # Create test artifacts directory
+    artifacts_dir = Path("transition_artifacts")
+    artifacts_dir.mkdir(exist_ok=True)
+    log_file = artifacts_dir / "lmstudio_integration_tests.log"
+
+    # Log lines are collected and written once, whatever the outcome
+    log = ["Starting LMStudio integration validation...\n"]
     try:
-        # Create test artifacts directory
-        artifacts_dir = Path("transition_artifacts")
-        artifacts_dir.mkdir(exist_ok=True)
-        log_file = artifacts_dir / "lmstudio_integration_tests.log"
-
-        with open(log_file, "w", encoding="utf-8") as f:
-            f.write("Starting LMStudio integration validation...\n")
-
-            # Check if the client file exists
-            if not Path("external_ai_integration.py").exists():
-                raise FileNotFoundError("LMStudio client file not found")
-            f.write("[OK] LMStudio client file exists\n")
-
-            # Initialize client
-            client = LMStudioClient()
-            f.write("[OK] LMStudio client initialized\n")
-
-            # Test API connection
-            test_context = {
-                "phase": "Test Phase",
-                "task_description": "Test Task",
-                "error_message": "Test Error",
-                "implementation_data": "Test Data"
-            }
+        # Check if the client file exists
+        if not Path("external_ai_integration.py").exists():
+            raise FileNotFoundError("LMStudio client file not found")
+        log.append("[OK] LMStudio client file exists\n")
+
+        # Initialize client
+        client = LMStudioClient(session=_SESSION)
+        log.append("[OK] LMStudio client initialized\n")
 
+        # Test API connection
+        test_context = {
+            "phase": "Test Phase",
+            "task_description": "Test Task",
+            "error_message": "Test Error",
+            "implementation_data": "Test Data"
+        }
+
+        if dry_run:
+            response = DRY_RUN_RESPONSE
+            log.append("[INFO] Dry run, LMStudio API not contacted\n")
+        else:
             response = client.generate_prompt(test_context)
-            if response.startswith("Error generating prompt:"):
-                raise ConnectionError(response)
+        if response.startswith("Error generating prompt:"):
+            raise ConnectionError(response)
 
-            # Check if response is a valid string
-            if not isinstance(response, str) or not response.strip():
-                raise ValueError("Invalid response from LMStudio API")
+        # Check if response is a valid string
+        if not isinstance(response, str) or not response.strip():
+            raise ValueError("Invalid response from LMStudio API")
 
-            f.write("[OK] Successfully connected to LMStudio API\n")
-            f.write(f"[INFO] Response length: {len(response)} characters\n")
+        if not dry_run:
+            log.append("[OK] Successfully connected to LMStudio API\n")
+        log.append(f"[INFO] Response length: {len(response)} characters\n")
 
-            # Test successful
-            result = {
-                "status": "success",
-                "artifacts": ["lmstudio_integration_tests.log"]
-            }
+        # Test successful
+        result = {
+            "status": "success",
+            "artifacts": ["lmstudio_integration_tests.log"]
+        }
 
     except Exception as e:
         result = {
@@ -57,11 +89,17 @@ def validate_lmstudio_integration():
             "error_message": str(e),
             "artifacts": ["lmstudio_integration_tests.log"]
         }
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"[ERROR] {str(e)}\n")
+        log.append(f"[ERROR] {str(e)}\n")
+
+    finally:
+        log_file.write_bytes("".join(log).encode("utf-8"))
 
-    print(json.dumps(result))
+    print(_to_json(result))
 
 
 if __name__ == "__main__":
-    validate_lmstudio_integration()
+    parser = argparse.ArgumentParser(
+        description="Validate the LMStudio integration")
+    parser.add_argument("--dry-run", action="store_true",
+                        help="Use a canned response instead of calling the API")
+    validate_lmstudio_integration(parser.parse_args().dry_run)
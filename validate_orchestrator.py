@@ -4,6 +4,18 @@ from pathlib import Path
 import inspect
 import subprocess
 
+try:
+    import orjson
+
+    def _to_json(data) -> str:
+        """Serialize a result dict for stdout."""
+        return orjson.dumps(data).decode()
+except ImportError:
+    # The script is also run on its own, outside the project environment
+    def _to_json(data) -> str:
+        """Serialize a result dict for stdout."""
+        return json.dumps(data)
+
 from orchestrator import Orchestrator, TaskResult
 from validation_system.core import TransitionValidator
 from cursor_client import FileOperations
@@ -12,50 +24,49 @@ from external_ai_integration import LMStudioClient
 
 def validate_orchestrator():
     """Validate the Orchestrator implementation."""
+    # Create test artifacts directory
+    artifacts_dir = Path("transition_artifacts")
+    artifacts_dir.mkdir(exist_ok=True)
+    log_file = artifacts_dir / "orchestrator_tests.log"
+
+    # Log lines are collected and written in one go at the end
+    lines = ["Starting Orchestrator validation...\n"]
     try:
-        # Create test artifacts directory
-        artifacts_dir = Path("transition_artifacts")
-        artifacts_dir.mkdir(exist_ok=True)
-        log_file = artifacts_dir / "orchestrator_tests.log"
-
-        with open(log_file, "w", encoding="utf-8") as f:
-            f.write("Starting Orchestrator validation...\n")
-
-            # Initialize orchestrator
-            orchestrator = Orchestrator()
-            f.write("[OK] Orchestrator instance created successfully\n")
-
-            # Test checklist loading
-            orchestrator.load_checklist("smooth_operator_impl")
-            f.write("[OK] Checklist loaded successfully\n")
-
-            # Check if status is initialized
-            if not orchestrator.status:
-                raise ValueError("Status not initialized")
-            f.write("[OK] Status initialized\n")
-
-            # Check if phases are tracked
-            phases = orchestrator.current_checklist["checklist"]["phases"]
-            for phase in phases:
-                phase_name = phase["name"]
-                if phase_name not in orchestrator.status:
+        # Initialize orchestrator
+        orchestrator = Orchestrator()
+        lines.append("[OK] Orchestrator instance created successfully\n")
+
+        # Test checklist loading
+        orchestrator.load_checklist("smooth_operator_impl")
+        lines.append("[OK] Checklist loaded successfully\n")
+
+        # Check if status is initialized
+        status = orchestrator.status
+        if not status:
+            raise ValueError("Status not initialized")
+        lines.append("[OK] Status initialized\n")
+
+        # Check that every phase and task is tracked
+        for phase in orchestrator.current_checklist["checklist"]["phases"]:
+            phase_name = phase["name"]
+            if phase_name not in status:
+                raise ValueError(
+                    f"Phase {phase_name} not tracked in status")
+            lines.append(f"[OK] Phase {phase_name} tracked in status\n")
+
+            task_statuses = status[phase_name]["tasks"]
+            for task in phase["tasks"]:
+                task_desc = task["description"]
+                if task_desc not in task_statuses:
                     raise ValueError(
-                        f"Phase {phase_name} not tracked in status")
-                f.write(f"[OK] Phase {phase_name} tracked in status\n")
-
-                # Check if tasks are tracked
-                for task in phase["tasks"]:
-                    task_desc = task["description"]
-                    if task_desc not in orchestrator.status[phase_name]["tasks"]:
-                        raise ValueError(
-                            f"Task {task_desc} not tracked in status")
-                    f.write(f"[OK] Task {task_desc} tracked in status\n")
-
-            # Test successful
-            result = {
-                "status": "success",
-                "artifacts": ["orchestrator_tests.log"]
-            }
+                        f"Task {task_desc} not tracked in status")
+                lines.append(f"[OK] Task {task_desc} tracked in status\n")
+
+        # Test successful
+        result = {
+            "status": "success",
+            "artifacts": ["orchestrator_tests.log"]
+        }
 
     except Exception as e:
         result = {
@@ -63,10 +74,12 @@ def validate_orchestrator():
             "error_message": str(e),
             "artifacts": ["orchestrator_tests.log"]
         }
-        with open(log_file, "a", encoding="utf-8") as f:
-            f.write(f"[ERROR] {str(e)}\n")
+        lines.append(f"[ERROR] {str(e)}\n")
+
+    with open(log_file, "w", encoding="utf-8") as f:
+        f.writelines(lines)
 
-    print(json.dumps(result))
+    print(_to_json(result))
     sys.exit(0 if result["status"] == "success" else 1)
 
 
@@ -1,9 +1,28 @@
 import sys
 import os
 import argparse
+import hashlib
+import json
+import pickle
+import re
+import shlex
 import yaml
 import subprocess
+import atexit
 import logging
+import logging.handlers
+import queue
+
+# libyaml's C loader when PyYAML was built with it, else the pure-Python one
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:
+    from yaml import SafeLoader
+
+# Composing one subtree at a time needs the pure-Python composer
+from yaml.loader import SafeLoader as _StreamingLoader
+from yaml.events import (MappingEndEvent, MappingStartEvent, SequenceEndEvent,
+                         SequenceStartEvent, StreamEndEvent)
 
 # Import your existing validation system
 from transition_checklist.validation_system import TransitionValidator, ChecklistStatus
@@ -14,15 +33,164 @@ from transition_checklist.validation_system import TransitionValidator, Checklis
 # OPTIONAL: If you want to call collect_diagnostics.sh
 COLLECT_SCRIPT = "transition_checklist/collect_diagnostics.sh"
 
+# Parsed checklist snapshot, reused while the YAML file is unchanged
+CHECKLIST_CACHE = "transition_artifacts/.checklist.cache"
+
+# Checklists at least this large are walked task by task rather than loaded
+# whole, trading parse speed for memory
+STREAM_CHECKLIST_BYTES = 64 * 1024 * 1024
+
+# Results of tasks marked `cached: true`, one JSON file per task hash
+TASK_CACHE_DIR = "transition_artifacts/.task_cache"
+
 # Example: Where to store overall orchestrator logs
 ORCHESTRATOR_LOG = "transition_artifacts/orchestrator.log"
 
-# Setup module-level logger
+# orchestrator_report.md layout, one write per phase heading and per task
+_REPORT_PHASE_TPL = "\n## Phase: {0}\n"
+_REPORT_TASK_TPL = "- **Task**: {0}\n  - **Result**: {1}\n  - **Message**: {2}\n"
+
+# Which expected artifact feeds which validation argument, first match wins
+_ARTIFACT_KINDS = (
+    ("dependency_map", lambda a: "dependency_map" in a),
+    ("wizard_references", lambda a: "wizard_references" in a),
+    ("patch", lambda a: "code_diff" in a or "patch" in a),
+    ("test_results", lambda a: "test_results" in a and a.endswith(".xml")),
+)
+
+# Artifact kinds each known validation method takes as arguments, in order,
+# and the message reported when one of them is missing
+_VALIDATION_ARGS = {
+    "validate_no_wizard_dependencies": (
+        ("dependency_map", "wizard_references"),
+        "Missing required artifacts for validate_no_wizard_dependencies"),
+    "validate_code_changes": (
+        ("patch",), "Missing patch artifact for validate_code_changes"),
+    "validate_advanced_view_functionality": (
+        ("test_results",), "Missing test XML for advanced view validation"),
+}
+
+
+def _classify_artifacts(artifacts):
+    """Sort artifacts by kind in a single pass, keeping the first of each kind."""
+    found = {}
+    for a in artifacts:
+        for kind, matches in _ARTIFACT_KINDS:
+            if kind not in found and matches(a):
+                found[kind] = a
+    return found
+
+
+def _construct_next(loader):
+    """Build the Python object for the next node in the event stream, and only that node."""
+    data = loader.construct_object(loader.compose_node(None, None), deep=True)
+    # Constructed objects are otherwise kept until the document ends
+    loader.constructed_objects.clear()
+    return data
+
+
+def _iter_phase(loader):
+    """
+    Yield (phase_name, None) and then (phase_name, task) for each task of the
+    phase mapping at the head of the event stream.
+    """
+    loader.get_event()  # MappingStartEvent
+    name, named, pending = "Unnamed Phase", False, []
+    while not loader.check_event(MappingEndEvent):
+        key = _construct_next(loader)
+        if key == "name" and not named:
+            name, named = _construct_next(loader), True
+            yield name, None
+            # Tasks listed before the name were held back until now
+            for task in pending:
+                yield name, task
+            pending = []
+        elif key == "tasks" and loader.check_event(SequenceStartEvent):
+            loader.get_event()
+            while not loader.check_event(SequenceEndEvent):
+                task = _construct_next(loader)
+                if named:
+                    yield name, task
+                else:
+                    pending.append(task)
+            loader.get_event()
+        else:
+            _construct_next(loader)
+    loader.get_event()
+
+    if not named:
+        yield name, None
+        for task in pending:
+            yield name, task
+
+
+def _iter_checklist(path):
+    """
+    Walk a checklist file like AIChecklistOrchestrator._iter_tasks, holding a
+    single task in memory at a time. Raises ValueError if there is no
+    top-level 'phases' key.
+    """
+    with open(path, "rb") as f:
+        loader = _StreamingLoader(f)
+        try:
+            loader.get_event()  # StreamStartEvent
+            if loader.check_event(StreamEndEvent):
+                raise ValueError("'phases' key missing")
+            loader.get_event()  # DocumentStartEvent
+            if not loader.check_event(MappingStartEvent):
+                raise ValueError("'phases' key missing")
+            loader.get_event()
+
+            found = False
+            while not loader.check_event(MappingEndEvent):
+                key = _construct_next(loader)
+                if key != "phases" or not loader.check_event(SequenceStartEvent):
+                    _construct_next(loader)
+                    found = found or key == "phases"
+                    continue
+                found = True
+                loader.get_event()
+                while not loader.check_event(SequenceEndEvent):
+                    yield from _iter_phase(loader)
+                loader.get_event()
+            if not found:
+                raise ValueError("'phases' key missing")
+        finally:
+            loader.dispose()
+
+
+def _task_hash(task):
+    """Hash a task's definition together with the contents of its patch file."""
+    h = hashlib.blake2b(
+        json.dumps(task, sort_keys=True, default=str).encode("utf-8"),
+        digest_size=16)
+    h.update(b"|")
+    patch_file = task.get("patch_file")
+    if patch_file:
+        try:
+            with open(patch_file, "rb") as f:
+                for chunk in iter(lambda: f.read(1 << 16), b""):
+                    h.update(chunk)
+        except OSError:
+            pass
+    return h.hexdigest()
+
+
+# Commands containing any of these need a shell to be interpreted correctly
+_SHELL_METACHARS = re.compile(r"[|&;<>()$`\\*?~\n]")
+
+# Setup module-level logger. Records are formatted and queued on the calling
+# thread; a listener thread does the file writes
+_log_queue = queue.SimpleQueue()
 logging.basicConfig(
-    filename=ORCHESTRATOR_LOG,
     level=logging.INFO,
-    format="%(asctime)s - %(levelname)s - %(message)s"
+    format="%(asctime)s - %(levelname)s - %(message)s",
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+_log_listener = logging.handlers.QueueListener(
+    _log_queue, logging.FileHandler(ORCHESTRATOR_LOG))
+_log_listener.start()
+atexit.register(_log_listener.stop)
 logger = logging.getLogger(__name__)
 
 
@@ -40,6 +208,8 @@ class AIChecklistOrchestrator:
         # Create a TransitionValidator instance from your existing system
         self.validator = TransitionValidator(
             artifacts_dir="transition_artifacts")
+        # Validator methods by name, resolved on first use (None if missing)
+        self._methods = {}
 
         # In-memory store for phase/task statuses
         # e.g. { phase_name: [ (task_desc, success_bool, message), ... ] }
@@ -52,35 +222,60 @@ class AIChecklistOrchestrator:
         # self.ai_client = CursorAI() if self.use_cursor_ai else None
 
     def _load_checklist(self):
-        if not os.path.exists(self.checklist_path):
+        """
+        Parse the checklist, or return None if it is large enough to be
+        streamed by _iter_tasks instead.
+        """
+        try:
+            st = os.stat(self.checklist_path)
+        except FileNotFoundError:
             logger.error(f"Checklist file not found: {self.checklist_path}")
             sys.exit(1)
+        if st.st_size >= STREAM_CHECKLIST_BYTES:
+            return None
+
+        key = (os.path.abspath(self.checklist_path), st.st_mtime_ns, st.st_size)
+        try:
+            with open(CHECKLIST_CACHE, "rb") as f:
+                cached_key, data = pickle.load(f)
+            if cached_key == key:
+                return data
+        except Exception:
+            # Missing, stale-format or unreadable cache: fall back to parsing
+            pass
 
         with open(self.checklist_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=SafeLoader)
             if not data or "phases" not in data:
                 logger.error(
                     "Invalid checklist file format. 'phases' key missing.")
                 sys.exit(1)
-            return data
+
+        try:
+            tmp_path = CHECKLIST_CACHE + ".tmp"
+            with open(tmp_path, "wb") as f:
+                pickle.dump((key, data), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, CHECKLIST_CACHE)
+        except OSError:
+            # Caching is best-effort
+            pass
+        return data
 
     def run(self):
         """
         Main entry point to iterate over phases and tasks in the checklist,
         execute them, and run validations.
         """
-        phases = self.checklist_data.get("phases", [])
-        for phase in phases:
-            phase_name = phase.get("name", "Unnamed Phase")
-            tasks = phase.get("tasks", [])
-            logger.info(f"--- Starting Phase: {phase_name} ---")
-            self.results[phase_name] = []
+        for phase_name, task in self._iter_tasks():
+            if task is None:
+                logger.info(f"--- Starting Phase: {phase_name} ---")
+                self.results[phase_name] = []
+                continue
 
-            for task in tasks:
-                success, message = self._execute_task(phase_name, task)
-                # Store the result
-                self.results[phase_name].append(
-                    (task.get("description", "Task"), success, message))
+            success, message = self._execute_task(phase_name, task)
+            # Store the result
+            self.results[phase_name].append(
+                (task.get("description", "Task"), success, message))
 
             # Possibly skip next phases if a critical failure
             # (You can add logic here if you want to abort on failure)
@@ -94,7 +289,61 @@ class AIChecklistOrchestrator:
 
         logger.info("All phases completed. Orchestrator exiting.")
 
+    def _iter_tasks(self):
+        """
+        Yield (phase_name, None) at the start of each phase, then
+        (phase_name, task) for each of its tasks, in checklist order.
+        """
+        if self.checklist_data is None:
+            try:
+                yield from _iter_checklist(self.checklist_path)
+            except ValueError:
+                logger.error(
+                    "Invalid checklist file format. 'phases' key missing.")
+                sys.exit(1)
+            return
+
+        for phase in self.checklist_data.get("phases", []):
+            phase_name = phase.get("name", "Unnamed Phase")
+            yield phase_name, None
+            for task in phase.get("tasks", []):
+                yield phase_name, task
+
     def _execute_task(self, phase_name, task):
+        """
+        Execute a single task, or, for tasks marked `cached: true`, reuse the
+        result of an earlier successful run if neither the task nor its
+        patch file has changed since.
+        """
+        if not task.get("cached"):
+            return self._run_task(phase_name, task)
+
+        cache_file = os.path.join(TASK_CACHE_DIR, f"{_task_hash(task)}.json")
+        try:
+            with open(cache_file, "rb") as f:
+                cached = json.load(f)
+            logger.info(
+                f"[{phase_name}] Reusing cached result for task: "
+                f"{task.get('description', 'No description')}")
+            return (cached["success"], cached["message"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        success, message = self._run_task(phase_name, task)
+        if success:
+            # Failures are always retried, so only successes are stored
+            try:
+                os.makedirs(TASK_CACHE_DIR, exist_ok=True)
+                tmp_path = cache_file + ".tmp"
+                with open(tmp_path, "w", encoding="utf-8") as f:
+                    json.dump({"success": success, "message": message}, f)
+                os.replace(tmp_path, cache_file)
+            except OSError:
+                # Caching is best-effort
+                pass
+        return (success, message)
+
+    def _run_task(self, phase_name, task):
         """
         Execute a single task from the checklist.
         This can include applying patches, running a command, or using AI prompts.
@@ -125,10 +374,16 @@ class AIChecklistOrchestrator:
             if not success:
                 return (False, f"AI code modification failed: {message}")
 
-        # 4) Artifacts: If the checklist says an artifact is expected, we can check existence
+        # 4) Artifacts: If the checklist says an artifact is expected, we can check existence.
+        # One directory listing per distinct directory instead of a stat() per
+        # artifact. A name missing from the listing is confirmed with exists(),
+        # which also accepts other spellings of the same path (a different
+        # case on case-insensitive filesystems, "..", a trailing slash)
         artifacts = task.get("artifacts", [])
+        index = self._artifact_index(os.path.dirname(a) for a in artifacts)
         for artifact in artifacts:
-            if not os.path.exists(artifact):
+            head, name = os.path.split(artifact)
+            if name not in index[head] and not os.path.exists(artifact):
                 logger.warning(f"Expected artifact not found: {artifact}")
 
         # 5) Validation
@@ -141,6 +396,17 @@ class AIChecklistOrchestrator:
         # If no validation or patch or command, assume success
         return (True, "Task completed successfully (no validation)")
 
+    @staticmethod
+    def _artifact_index(dirs):
+        """Map each directory to the set of names it currently contains."""
+        index = {}
+        for d in set(dirs):
+            try:
+                index[d] = frozenset(os.listdir(d or "."))
+            except OSError:
+                index[d] = frozenset()
+        return index
+
     def _apply_patch(self, patch_file):
         """Apply a unified diff patch to the codebase using git apply."""
         if not os.path.exists(patch_file):
@@ -157,9 +423,25 @@ class AIChecklistOrchestrator:
     def _run_shell_command(self, cmd):
         """Run a shell command and return success/fail plus any output or error."""
         logger.info(f"Running command: {cmd}")
+        argv = None
+        if not _SHELL_METACHARS.search(cmd):
+            try:
+                argv = shlex.split(cmd)
+            except ValueError:
+                pass
         try:
-            result = subprocess.run(
-                cmd, shell=True, capture_output=True, text=True, check=True)
+            result = None
+            if argv:
+                # Executed directly, skipping the intermediate /bin/sh
+                try:
+                    result = subprocess.run(
+                        argv, capture_output=True, text=True, check=True)
+                except OSError:
+                    # Not runnable directly, e.g. a shell builtin
+                    pass
+            if result is None:
+                result = subprocess.run(
+                    cmd, shell=True, capture_output=True, text=True, check=True)
             if result.stdout:
                 logger.info(result.stdout.strip())
             if result.stderr:
@@ -191,51 +473,36 @@ class AIChecklistOrchestrator:
         Call a specific method on the TransitionValidator instance, returning (bool, message).
         We match the method_name with the ones in validation_system.py
         """
-        if not hasattr(self.validator, method_name):
+        try:
+            method = self._methods[method_name]
+        except KeyError:
+            method = self._methods[method_name] = getattr(
+                self.validator, method_name, None)
+        if method is None:
             logger.warning(
                 f"Validation method {method_name} not found in TransitionValidator.")
             return (False, f"Validation method {method_name} not found")
 
         # Some validations require file paths, see your existing system
         # e.g. validate_no_wizard_dependencies(self, dependency_map, wizard_refs)
-        # We'll guess based on known signatures or pass nothing:
-        method = getattr(self.validator, method_name)
+        # We'll guess based on known signatures or pass nothing.
 
         try:
-            # Example: if method_name == "validate_no_wizard_dependencies", we guess we have
-            # 'dependency_map.dot' and 'wizard_references.txt' as artifacts.
-            # In reality, you'd parse or pass from the checklist or artifacts array:
-            if method_name == "validate_no_wizard_dependencies":
-                # Possibly find relevant artifacts from the list
-                # This is 100% example logic—adapt to your real usage
-                dependency_map = next(
-                    (a for a in artifacts if "dependency_map" in a), None)
-                wizard_refs = next(
-                    (a for a in artifacts if "wizard_references" in a), None)
-                if not dependency_map or not wizard_refs:
-                    return (False, "Missing required artifacts for validate_no_wizard_dependencies")
-                ok, msg = method(dependency_map, wizard_refs)
-
-            elif method_name == "validate_code_changes":
-                # Similarly
-                patch_file = next(
-                    (a for a in artifacts if "code_diff" in a or "patch" in a), None)
-                if not patch_file:
-                    return (False, "Missing patch artifact for validate_code_changes")
-                ok, msg = method(patch_file)
-
-            elif method_name == "validate_advanced_view_functionality":
-                # e.g. we expect the test_results.xml among the artifacts
-                test_xml = next(
-                    (a for a in artifacts if "test_results" in a and a.endswith(".xml")), None)
-                if not test_xml:
-                    return (False, "Missing test XML for advanced view validation")
-                ok, msg = method(test_xml)
-
-            else:
-                # For other methods, you might need to pass arguments differently or read them from the checklist
-                # If it's a no-argument method, just call it:
+            # Example: validate_no_wizard_dependencies is given the
+            # 'dependency_map.dot' and 'wizard_references.txt' artifacts.
+            # In reality, you'd parse or pass from the checklist or artifacts array.
+            # For other methods, you might need to pass arguments differently or
+            # read them from the checklist; unlisted methods are called with none.
+            spec = _VALIDATION_ARGS.get(method_name)
+            if spec is None:
                 ok, msg = method()
+            else:
+                kinds, missing_message = spec
+                found = _classify_artifacts(artifacts or ())
+                args = [found.get(kind) for kind in kinds]
+                if not all(args):
+                    return (False, missing_message)
+                ok, msg = method(*args)
 
             # Update deliverable status if you want
             # For demonstration, let's say each validation is tied to one deliverable
@@ -252,20 +519,16 @@ class AIChecklistOrchestrator:
         """
         Summarize phase/task results to a markdown file, e.g. transition_artifacts/orchestrator_report.md
         """
-        lines = ["# Orchestrator Report", ""]
-        for phase_name, tasks in self.results.items():
-            lines.append(f"## Phase: {phase_name}")
-            for (task_desc, success, message) in tasks:
-                status_str = "PASS" if success else "FAIL"
-                lines.append(f"- **Task**: {task_desc}")
-                lines.append(f"  - **Result**: {status_str}")
-                lines.append(f"  - **Message**: {message}")
-            lines.append("")  # blank line
-
         report_path = os.path.join(
             "transition_artifacts", "orchestrator_report.md")
-        with open(report_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        # Written straight through a large buffer rather than joined in memory
+        with open(report_path, "w", buffering=1 << 20, encoding="utf-8") as f:
+            f.write("# Orchestrator Report\n")
+            for phase_name, tasks in self.results.items():
+                f.write(_REPORT_PHASE_TPL.format(phase_name))
+                for (task_desc, success, message) in tasks:
+                    f.write(_REPORT_TASK_TPL.format(
+                        task_desc, "PASS" if success else "FAIL", message))
 
         logger.info(f"Orchestrator report generated at {report_path}")
 
@@ -1,24 +1,120 @@
-from typing import List, Dict, Any
+import hashlib
+import re
+import shlex
+import sqlite3
+import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Dict, Any, Optional, Tuple
+
+import orjson
+
 from external_ai_integration import LMStudioClient
 
+# Commands containing any of these need a shell to be interpreted correctly
+_SHELL_METACHARS = re.compile(r"[|&;<>()$`\\*?~\n]")
+
+
+def _run_diagnostics(command: str) -> Tuple[int, str]:
+    """
+    Run a diagnostics command and return (exit code, stdout).
+    Plain commands are executed without a shell, and a bare echo or exit
+    is answered without starting a process at all.
+    """
+    argv = None
+    if not _SHELL_METACHARS.search(command):
+        try:
+            argv = shlex.split(command)
+        except ValueError:
+            pass
+    if argv:
+        if argv[0] == "echo" and not any(arg.startswith("-") for arg in argv[1:]):
+            return 0, " ".join(argv[1:]) + "\n"
+        if argv[0] == "exit" and len(argv) <= 2:
+            if len(argv) == 1:
+                return 0, ""
+            if argv[1].isdigit():
+                return int(argv[1]) & 0xFF, ""
+        try:
+            result = subprocess.run(argv, capture_output=True, text=True)
+            return result.returncode, result.stdout
+        except OSError:
+            # Not runnable directly, e.g. a shell builtin
+            pass
+    result = subprocess.run(command, shell=True, capture_output=True, text=True)
+    return result.returncode, result.stdout
+
+
+# "resolved" as a word of its own ("unresolved" doesn't count), and the
+# negated forms that turn it into the opposite verdict
+_RESOLVED_WORD = re.compile(r"\bresolved\b", re.I)
+_NEGATED_RESOLVED = re.compile(
+    r"(?:\bnot|\bnever|n't|\bno longer)\s+(?:\w+\s+){0,2}resolved\b", re.I)
+
+# Seconds a "resolved" answer is trusted before LMStudio is asked again
+LLM_CACHE_TTL = 3600.0
+
+
+def _says_resolved(response: str) -> bool:
+    """Whether an LMStudio answer reports the blocker as resolved, and not as still open."""
+    return (_RESOLVED_WORD.search(response) is not None
+            and _NEGATED_RESOLVED.search(response) is None)
+
 
 class BlockerResolver:
     """Resolver for automatically checking and resolving task blockers."""
 
-    def __init__(self):
-        """Initialize the BlockerResolver with an LMStudio client."""
-        self.ai_client = LMStudioClient()
+    def __init__(self, ai_client: Optional[LMStudioClient] = None,
+                 cache_path: Optional[str] = None,
+                 cache_ttl: float = LLM_CACHE_TTL):
+        """
+        Initialize the BlockerResolver with an LMStudio client.
+        Pass an existing client to share its HTTP connection pool, and a
+        cache_path to keep LMStudio answers in a SQLite file across runs;
+        answers expire after cache_ttl seconds.
+        """
+        self.ai_client = ai_client if ai_client is not None else LMStudioClient()
+        # LMStudio answers keyed by (blocker type, prompt digest), with the
+        # time they were given. Only "resolved" answers are kept: a blocker
+        # still open now may be fixed by the next check, so those are always
+        # asked again, and resolved ones are re-checked once they expire
+        self._llm_cache: Dict[Tuple[str, str], Tuple[str, float]] = {}
+        self._llm_ttl = cache_ttl
+        self._llm_lock = threading.Lock()
+        self._llm_db = None
+        if cache_path is not None:
+            self._llm_db = sqlite3.connect(cache_path, check_same_thread=False)
+            self._llm_db.execute(
+                "CREATE TABLE IF NOT EXISTS verdicts (blocker_type TEXT, "
+                "prompt_hash TEXT, response TEXT, answered_at REAL, "
+                "PRIMARY KEY (blocker_type, prompt_hash))")
+            self._llm_cache.update(
+                ((blocker_type, prompt_hash), (response, answered_at))
+                for blocker_type, prompt_hash, response, answered_at in self._llm_db.execute(
+                    "SELECT blocker_type, prompt_hash, response, answered_at "
+                    "FROM verdicts WHERE answered_at > ?", (time.time() - cache_ttl,))
+                if _says_resolved(response))
+        # Blocker checks wait on diagnostics and HTTP, so they overlap well.
+        # Threads are only started as checks queue up, so a small batch never
+        # pays for the full pool
+        self._executor = ThreadPoolExecutor(max_workers=32)
 
     def resolve_blockers(self, blockers: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Attempt to resolve a list of blockers.
         Returns a list of blockers that could not be resolved.
         """
-        unresolved = []
-        for blocker in blockers:
-            if not self._check_if_resolved(blocker):
-                unresolved.append(blocker)
-        return unresolved
+        if len(blockers) == 1:
+            return list(filter(None, [self.resolve_one(blockers[0])]))
+        return list(filter(None, self._executor.map(self.resolve_one, blockers)))
+
+    def resolve_one(self, blocker: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """
+        Attempt to resolve a single blocker.
+        Returns the blocker if it is still unresolved, otherwise None.
+        """
+        return None if self._check_if_resolved(blocker) else blocker
 
     def _check_if_resolved(self, blocker: Dict[str, Any]) -> bool:
         """
@@ -29,24 +125,17 @@ class BlockerResolver:
 
         # Run diagnostics if available
         if "diagnostics" in resolution:
-            import subprocess
             try:
-                result = subprocess.run(
-                    resolution["diagnostics"],
-                    shell=True,
-                    capture_output=True,
-                    text=True
-                )
-                if result.returncode != 0:
+                returncode, stdout = _run_diagnostics(resolution["diagnostics"])
+                if returncode != 0:
                     return False
 
                 # Parse JSON output if present
                 try:
-                    import json
-                    output = json.loads(result.stdout)
+                    output = orjson.loads(stdout)
                     if output.get("status") != "success":
                         return False
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     pass
             except Exception:
                 return False
@@ -54,12 +143,8 @@ class BlockerResolver:
         # Check if LMStudio prompt is available and use it
         prompt = resolution.get("lmstudio_prompt")
         if prompt:
-            response = self.ai_client.generate_prompt({
-                "phase": "Blocker Resolution",
-                "task_description": f"Checking blocker: {blocker['type']}",
-                "implementation_data": prompt
-            })
-            return "resolved" in response.lower()
+            response = self._ask_llm(blocker["type"], prompt)
+            return _says_resolved(response)
 
         # If no diagnostics or prompt, check if required experts are available
         required_experts = resolution.get("required_experts", [])
@@ -68,3 +153,35 @@ class BlockerResolver:
             return True
 
         return False
+
+    def _ask_llm(self, blocker_type: str, prompt: Any) -> str:
+        """
+        Ask LMStudio whether a blocker is resolved, answering questions
+        already answered "resolved" from the cache instead of another round-trip.
+        """
+        key = (blocker_type, hashlib.blake2b(
+            str(prompt).encode("utf-8"), digest_size=16).hexdigest())
+        with self._llm_lock:
+            cached = self._llm_cache.get(key)
+        if cached is not None and time.time() - cached[1] < self._llm_ttl:
+            return cached[0]
+
+        response = self.ai_client.generate_prompt({
+            "phase": "Blocker Resolution",
+            "task_description": f"Checking blocker: {blocker_type}",
+            "implementation_data": prompt
+        })
+        # Failed requests and blockers still open are asked again next time
+        # rather than remembered
+        if response.startswith("Error generating prompt:") or not _says_resolved(response):
+            return response
+
+        answered_at = time.time()
+        with self._llm_lock:
+            self._llm_cache[key] = (response, answered_at)
+            if self._llm_db is not None:
+                with self._llm_db:
+                    self._llm_db.execute(
+                        "INSERT OR REPLACE INTO verdicts VALUES (?, ?, ?, ?)",
+                        (*key, response, answered_at))
+        return response
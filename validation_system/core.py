@@ -1,9 +1,23 @@
-import json
-import subprocess
+import asyncio
+import atexit
+import importlib
+import io
+import multiprocessing
+import os
+import runpy
+import sys
+import threading
+import time
+import traceback
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import redirect_stderr, redirect_stdout
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, Optional
-from dataclasses import dataclass
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+import orjson
 
 
 class ValidationStatus(Enum):
@@ -14,12 +28,111 @@ class ValidationStatus(Enum):
     SKIPPED = "skipped"
 
 
-@dataclass
-class ValidationResult:
-    """Result of a validation operation."""
+class ValidationResult(NamedTuple):
+    """Result of a validation operation. Artifacts map names to their paths."""
+    # An immutable tuple without a per-instance __dict__; dataclass(slots=True)
+    # needs Python 3.10, and slotted fields can't carry defaults before that
     status: ValidationStatus
-    artifacts: Dict[str, Any]
+    artifacts: Dict[str, Path]
     error_message: Optional[str] = None
+    metrics: Optional[Dict[str, Any]] = None
+
+
+@lru_cache(maxsize=256)
+def _load_metrics(path_str: str, mtime_ns: int) -> Dict[str, Any]:
+    """Parse a metrics file; the mtime in the key invalidates stale entries."""
+    return orjson.loads(Path(path_str).read_bytes())
+
+
+def _walk_files(path: str) -> Iterator[os.DirEntry]:
+    """Yield the file entries under a directory, without following symlinks."""
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            else:
+                yield entry
+
+
+# Long-lived interpreters for validation scripts, started on first use and
+# shared by every validator in the process. Workers are spawned rather than
+# forked: the parent runs other threads (status writer, blocker checks), and
+# a fork would copy their locks in whatever state they happen to be in
+_script_pool: Optional[ProcessPoolExecutor] = None
+_script_pool_lock = threading.Lock()
+
+
+def _get_script_pool() -> ProcessPoolExecutor:
+    """Return the shared worker pool, starting it if needed."""
+    global _script_pool
+    if _script_pool is None:
+        with _script_pool_lock:
+            if _script_pool is None:
+                _script_pool = ProcessPoolExecutor(
+                    max_workers=os.cpu_count(),
+                    mp_context=multiprocessing.get_context("spawn"))
+    return _script_pool
+
+
+@atexit.register
+def shutdown_script_pool() -> None:
+    """Stop the shared worker pool; the next validation starts a new one."""
+    global _script_pool
+    with _script_pool_lock:
+        pool, _script_pool = _script_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+def _discard_script_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next call starts a fresh one."""
+    global _script_pool
+    with _script_pool_lock:
+        if _script_pool is pool:
+            _script_pool = None
+    pool.shutdown(wait=False)
+
+
+def _run_script(script: str, cwd: str) -> Tuple[int, str, str]:
+    """
+    Run a validation script as __main__ inside a pool worker.
+    Returns (exit code, stdout, stderr) as ``python script`` run in cwd would.
+
+    Workers are reused, so the modules a script imports are dropped again
+    afterwards: the next script, perhaps validating freshly patched code,
+    imports its own copies. Modules the worker had already loaded (the
+    standard library, this module) are shared.
+    """
+    stdout, stderr = io.StringIO(), io.StringIO()
+    saved_cwd, saved_argv = os.getcwd(), sys.argv
+    saved_modules = set(sys.modules)
+    # Source files may have appeared since the last script ran
+    importlib.invalidate_caches()
+    os.chdir(cwd)
+    sys.argv = [script]
+    sys.path.insert(0, os.path.dirname(os.path.abspath(script)))
+    try:
+        with redirect_stdout(stdout), redirect_stderr(stderr):
+            runpy.run_path(script, run_name="__main__")
+        code = None
+    except SystemExit as e:
+        code = e.code
+    except Exception:
+        traceback.print_exc(file=stderr)
+        code = 1
+    finally:
+        for name in set(sys.modules) - saved_modules:
+            del sys.modules[name]
+        sys.path.pop(0)
+        sys.argv = saved_argv
+        os.chdir(saved_cwd)
+
+    # Map the result the way the interpreter maps a script's exit status
+    if code is None:
+        return 0, stdout.getvalue(), stderr.getvalue()
+    if isinstance(code, int):
+        return code, stdout.getvalue(), stderr.getvalue()
+    return 1, stdout.getvalue(), stderr.getvalue() + f"{code}\n"
 
 
 class TransitionValidator:
@@ -31,65 +144,142 @@ class TransitionValidator:
 
     def validate_task(self, task: Dict[str, Any], phase_name: str) -> ValidationResult:
         """Validate a task using its validation script and collect artifacts."""
+        return self.submit_validation(task, phase_name).result()
+
+    async def validate_task_async(self, task: Dict[str, Any], phase_name: str) -> ValidationResult:
+        """Like validate_task, but waits on the script without blocking the event loop."""
+        return await asyncio.wrap_future(self.submit_validation(task, phase_name))
+
+    def submit_validation(self, task: Dict[str, Any], phase_name: str) -> "Future[ValidationResult]":
+        """
+        Start validating a task and return straight away.
+        The future resolves to the task's ValidationResult, so the caller can
+        do other work while the validation script runs.
+        """
+        outcome: "Future[ValidationResult]" = Future()
         try:
             if "validation" not in task:
-                return ValidationResult(ValidationStatus.SUCCESS, {})
+                outcome.set_result(ValidationResult(ValidationStatus.SUCCESS, {}))
+                return outcome
 
             validation = task["validation"]
             script = validation["script"]
-            expected_artifacts = validation.get("artifacts", [])
+            if not os.path.isfile(script):
+                outcome.set_result(ValidationResult(
+                    ValidationStatus.FAILURE,
+                    {},
+                    f"Validation script not found: {script}"
+                ))
+                return outcome
 
-            # Run the validation script
-            result = subprocess.run(
-                ["python", script],
-                capture_output=True,
-                text=True
-            )
+            # Run the validation script in a pooled interpreter
+            pool = _get_script_pool()
+            job = pool.submit(_run_script, script, os.getcwd())
+        except Exception as e:
+            outcome.set_result(ValidationResult(
+                ValidationStatus.FAILURE,
+                {},
+                f"Validation error: {str(e)}"
+            ))
+            return outcome
 
-            if result.returncode != 0:
-                return ValidationResult(
+        def finish(job: "Future[Tuple[int, str, str]]") -> None:
+            try:
+                outcome.set_result(self._interpret_result(validation, *job.result()))
+            except Exception as e:
+                if isinstance(e, BrokenProcessPool):
+                    _discard_script_pool(pool)
+                outcome.set_result(ValidationResult(
                     ValidationStatus.FAILURE,
                     {},
-                    f"Validation script failed: {result.stderr}"
-                )
+                    f"Validation error: {str(e)}"
+                ))
 
-            try:
-                output = json.loads(result.stdout)
-                status = output.get("status", "failure")
-                artifacts = {}
-
-                # Check for expected artifacts
-                for artifact in expected_artifacts:
-                    artifact_path = self.artifacts_dir / artifact
-                    if artifact_path.exists():
-                        with open(artifact_path, 'r') as f:
-                            artifacts[artifact] = f.read()
-                    else:
-                        return ValidationResult(
-                            ValidationStatus.FAILURE,
-                            artifacts,
-                            f"Missing artifact: {artifact}"
-                        )
-
-                if status == "success":
-                    return ValidationResult(ValidationStatus.SUCCESS, artifacts)
+        job.add_done_callback(finish)
+        return outcome
+
+    async def validate_tasks(self, tasks: List[Dict[str, Any]],
+                             phase_name: str) -> List[ValidationResult]:
+        """
+        Validate independent tasks with their scripts running concurrently.
+        Results are returned in the same order as the tasks.
+        """
+        return list(await asyncio.gather(
+            *(self.validate_task_async(task, phase_name) for task in tasks)))
+
+    def _interpret_result(self, validation: Dict[str, Any], returncode: int,
+                          stdout: str, stderr: str) -> ValidationResult:
+        """Turn a finished validation script's exit status and output into a result."""
+        expected_artifacts = validation.get("artifacts", [])
+
+        if returncode != 0:
+            return ValidationResult(
+                ValidationStatus.FAILURE,
+                {},
+                f"Validation script failed: {stderr}"
+            )
+
+        try:
+            output = orjson.loads(stdout)
+            status = output.get("status", "failure")
+            artifacts = {}
+
+            # Check for expected artifacts; callers get the path and read
+            # the contents only if they need them
+            for artifact in expected_artifacts:
+                artifact_path = self.artifacts_dir / artifact
+                if artifact_path.exists():
+                    artifacts[artifact] = artifact_path
                 else:
                     return ValidationResult(
                         ValidationStatus.FAILURE,
                         artifacts,
-                        output.get("error_message", "Validation failed")
+                        f"Missing artifact: {artifact}"
                     )
 
-            except json.JSONDecodeError:
+            metrics = self._collect_metrics(self.artifacts_dir)
+            if status == "success":
+                return ValidationResult(
+                    ValidationStatus.SUCCESS, artifacts, metrics=metrics)
+            else:
                 return ValidationResult(
                     ValidationStatus.FAILURE,
-                    {},
-                    "Invalid validation script output format"
+                    artifacts,
+                    output.get("error_message", "Validation failed"),
+                    metrics
                 )
 
-        except Exception as e:
+        except orjson.JSONDecodeError:
             return ValidationResult(
                 ValidationStatus.FAILURE,
                 {},
-                f"Validation error: {str(e)}"
+                "Invalid validation script output format"
             )
+
+    def _collect_metrics(self, artifacts_dir: Path) -> Dict[str, Any]:
+        """Load metrics.json from the artifacts directory, if present."""
+        metrics_path = Path(artifacts_dir) / "metrics.json"
+        try:
+            mtime_ns = metrics_path.stat().st_mtime_ns
+        except FileNotFoundError:
+            return {}
+        # Copy so callers can't mutate the cached entry
+        return dict(_load_metrics(str(metrics_path), mtime_ns))
+
+    def cleanup_artifacts(self, task_id: str, max_age_days: int = 7) -> int:
+        """
+        Delete a task's artifacts that haven't been modified for max_age_days.
+        Returns the number of files removed.
+        """
+        task_dir = self.artifacts_dir / task_id
+        if not task_dir.is_dir():
+            return 0
+
+        cutoff = time.time() - max_age_days * 24 * 3600
+        # Directory entries carry their stat result, so each file costs one
+        # stat at most instead of separate exists/stat/unlink lookups
+        stale = [entry.path for entry in _walk_files(str(task_dir))
+                 if entry.stat(follow_symlinks=False).st_mtime < cutoff]
+        for path in stale:
+            os.unlink(path)
+        return len(stale)
@@ -79,6 +79,80 @@ def test_resolve_blockers_with_lmstudio_prompt(resolver, mock_lmstudio_client):
     mock_lmstudio_client.generate_prompt.assert_called_once()
 
 
+def test_repeated_lmstudio_prompts_are_cached(mock_lmstudio_client, tmp_path):
+    """Test that a repeated blocker prompt is only sent to LMStudio once, across runs."""
+    mock_lmstudio_client.generate_prompt.return_value = "Task resolved successfully"
+    cache_path = str(tmp_path / "llm_cache.sqlite")
+
+    blocker = {
+        "type": "TestBlocker",
+        "resolution": {
+            "lmstudio_prompt": "Test prompt"
+        }
+    }
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == []
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == []
+
+    mock_lmstudio_client.generate_prompt.assert_called_once()
+
+
+def test_unresolved_lmstudio_answers_are_not_cached(mock_lmstudio_client, tmp_path):
+    """Test that a blocker LMStudio reported as open is asked about again once fixed."""
+    mock_lmstudio_client.generate_prompt.side_effect = [
+        "Still blocked", "Task resolved successfully"]
+    cache_path = str(tmp_path / "llm_cache.sqlite")
+
+    blocker = {
+        "type": "TestBlocker",
+        "resolution": {
+            "lmstudio_prompt": "Test prompt"
+        }
+    }
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == [blocker]
+    # The underlying problem is fixed between runs
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == []
+
+    assert mock_lmstudio_client.generate_prompt.call_count == 2
+
+
+@pytest.mark.parametrize("answer", ["Blocker unresolved", "The blocker is not resolved"])
+def test_negative_lmstudio_answers_are_not_resolved(mock_lmstudio_client, tmp_path, answer):
+    """Test that answers mentioning "resolved" only to deny it are neither trusted nor cached."""
+    mock_lmstudio_client.generate_prompt.return_value = answer
+    cache_path = str(tmp_path / "llm_cache.sqlite")
+
+    blocker = {
+        "type": "TestBlocker",
+        "resolution": {
+            "lmstudio_prompt": "Test prompt"
+        }
+    }
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == [blocker]
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == [blocker]
+
+    assert mock_lmstudio_client.generate_prompt.call_count == 2
+
+
+def test_cached_lmstudio_answers_expire(mock_lmstudio_client, tmp_path):
+    """Test that a cached "resolved" answer is re-checked once it has expired."""
+    mock_lmstudio_client.generate_prompt.side_effect = [
+        "Task resolved successfully", "Blocker unresolved"]
+    cache_path = str(tmp_path / "llm_cache.sqlite")
+
+    blocker = {
+        "type": "TestBlocker",
+        "resolution": {
+            "lmstudio_prompt": "Test prompt"
+        }
+    }
+    assert BlockerResolver(cache_path=cache_path).resolve_blockers([blocker]) == []
+    # The blocker regressed; an expired answer doesn't hide that
+    resolver = BlockerResolver(cache_path=cache_path, cache_ttl=0)
+    assert resolver.resolve_blockers([blocker]) == [blocker]
+
+    assert mock_lmstudio_client.generate_prompt.call_count == 2
+
+
 def test_resolve_blockers_with_required_experts(resolver):
     """Test resolving blockers that require experts."""
     blockers = [
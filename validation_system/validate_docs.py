@@ -1,51 +1,94 @@
 #!/usr/bin/env python3
 
+import ast
+import fnmatch
+import os
 import sys
 import json
 import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Set
-
-
-def check_readme():
-    """Check if README.md exists and has required sections."""
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple
+
+# Below this many files, worker start-up costs more than it saves
+PARALLEL_MIN_FILES = 128
+
+# Per-file docstring metrics from earlier runs, keyed by path and tagged
+# with the (mtime_ns, size) they were computed at
+DOCS_CACHE = ".docs_cache.json"
+# Bump whenever _score_file or _iter_statements changes what a file's
+# metrics are; caches written with another version are discarded
+DOCS_CACHE_VERSION = 1
+
+# Required README sections. A level 1 heading is the title and any
+# non-heading line the description; level 2 headings are recognised by
+# their leading words, tried in order
+_README_H2_PREFIXES = (
+    ("Installation", "installation"),
+    ("Setup", "installation"),
+    ("Getting Started", "installation"),
+    ("Usage", "usage"),
+    ("How to Use", "usage"),
+    ("Example", "usage"),  # Also covers "Examples"
+    ("Contributing", "contributing"),
+    ("License", "license")
+)
+_README_SECTIONS = frozenset(
+    section for _, section in _README_H2_PREFIXES) | {"title", "description"}
+
+
+def _heading_section(line: str) -> Optional[str]:
+    """Return the required section a stripped '#' line heads, if any."""
+    text = line.lstrip("#")
+    level = len(line) - len(text)
+    # The markers must be followed by whitespace and then the heading text
+    if level > 2 or not text[:1].isspace():
+        return None
+    text = text.lstrip()
+    if level == 1:
+        return "title" if text else None
+    for prefix, section in _README_H2_PREFIXES:
+        if text.startswith(prefix):
+            return section
+    return None
+
+
+def check_readme() -> Tuple[float, List[str]]:
+    """
+    Check if README.md exists and has required sections.
+    Returns (score, missing sections), the score being the percentage of
+    required sections found; 0.0 if README.md is missing or unreadable.
+    """
     readme_path = Path("README.md")
     if not readme_path.exists():
-        return False, []
-
-    required_sections = {
-        "title": r"^#\s+.+",  # Title (level 1 heading)
-        "description": r"^(?!#).+",  # Non-heading text after title
-        "installation": r"^##\s+(?:Installation|Setup|Getting Started)",
-        "usage": r"^##\s+(?:Usage|How to Use|Examples?)",
-        "contributing": r"^##\s+Contributing",
-        "license": r"^##\s+License"
-    }
+        return 0.0, []
 
     found_sections = set()
-    current_content = ""
 
     try:
         with open(readme_path, encoding='utf-8') as f:
-            content = f.read()
-            lines = content.split("\n")
-
-            for line in lines:
+            # Read line by line, stopping as soon as every section is found
+            for line in f:
                 line = line.strip()
                 if not line:
                     continue
 
-                current_content += line + "\n"
-
-                for section, pattern in required_sections.items():
-                    if re.match(pattern, line) and section not in found_sections:
+                if line.startswith("#"):
+                    section = _heading_section(line)
+                    if section:
                         found_sections.add(section)
+                else:
+                    found_sections.add("description")
+                if len(found_sections) == len(_README_SECTIONS):
+                    break
     except UnicodeDecodeError as e:
         print(f"Warning: Could not read README.md: {e}", file=sys.stderr)
-        return False, []
+        return 0.0, []
 
-    missing_sections = set(required_sections.keys()) - found_sections
-    return bool(found_sections), list(missing_sections)
+    score = len(found_sections) / len(_README_SECTIONS) * 100
+    if len(found_sections) == len(_README_SECTIONS):
+        return score, []
+    return score, list(_README_SECTIONS - found_sections)
 
 
 def check_docs_structure():
@@ -68,6 +111,134 @@ def check_docs_structure():
     return bool(existing_components), existing_components
 
 
+# Environments, caches and build output hold no project code to score
+_EXCLUDE_DIRS = frozenset({
+    "__pycache__", ".git", ".tox", ".nox", ".venv", "venv", "env",
+    ".mypy_cache", ".pytest_cache", "node_modules", "build", "dist", ".eggs"
+})
+
+
+def _iter_files(root: str, matches: Callable[[str], object]) -> Iterator[str]:
+    """
+    Yield the paths of files under root whose names match, in the order
+    Path.rglob would: a directory's own files first, then its subdirectories.
+    Directories named in _EXCLUDE_DIRS are not entered.
+    """
+    subdirs = []
+    with os.scandir(root) as it:
+        for entry in it:
+            # Directory entries carry their type, so no extra stat per file
+            if entry.is_dir(follow_symlinks=False):
+                if entry.name not in _EXCLUDE_DIRS:
+                    subdirs.append(entry.path)
+            elif matches(entry.name) and entry.is_file():
+                yield entry.path
+    for subdir in subdirs:
+        yield from _iter_files(subdir, matches)
+
+
+# Functions and classes are statements, so only statement bodies (including
+# except and case clauses) need walking, never the expressions inside them
+_BODY_NODES = (ast.stmt, ast.excepthandler) + (
+    (ast.match_case,) if hasattr(ast, "match_case") else ())
+
+
+def _iter_statements(tree: ast.AST) -> Iterator[ast.AST]:
+    """Yield the statement nodes of a tree, skipping expression subtrees."""
+    todo = [tree]
+    while todo:
+        node = todo.pop()
+        yield node
+        todo.extend(child for child in ast.iter_child_nodes(node)
+                    if isinstance(child, _BODY_NODES))
+
+
+def _score_file(py_file: str) -> Tuple[Optional[Dict[str, float]], Optional[str]]:
+    """
+    Count one file's functions and classes and their docstring coverage.
+    Returns (file_metrics, None), or (None, warning) if the file can't be read or parsed.
+    """
+    try:
+        # Hand the parser the raw bytes: it decodes them itself (honouring
+        # any coding cookie), so no separate decoded copy of the file is
+        # made. A mapping can't stand in for the bytes, as compile() expects
+        # a NUL-terminated buffer
+        with open(py_file, 'rb') as f:
+            source = f.read()
+
+        tree = ast.parse(source, filename=py_file)
+    except (UnicodeDecodeError, IOError, SyntaxError, ValueError) as e:
+        return None, f"Warning: Could not process file {py_file}: {e}"
+
+    # Count every function (sync or async, nested or not) and
+    # class, and which of them have a real docstring, in locals; the
+    # per-file dict is built once the counts are final
+    total_functions = documented_functions = 0
+    total_classes = documented_classes = 0
+    for node in _iter_statements(tree):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            total_functions += 1
+            if ast.get_docstring(node):
+                documented_functions += 1
+        elif isinstance(node, ast.ClassDef):
+            total_classes += 1
+            if ast.get_docstring(node):
+                documented_classes += 1
+
+    # Calculate file-level coverage
+    function_coverage = (
+        documented_functions / total_functions * 100
+        if total_functions > 0 else 100
+    )
+    class_coverage = (
+        documented_classes / total_classes * 100
+        if total_classes > 0 else 100
+    )
+    file_metrics = {
+        "total_functions": total_functions,
+        "documented_functions": documented_functions,
+        "total_classes": total_classes,
+        "documented_classes": documented_classes,
+        "function_coverage": function_coverage,
+        "class_coverage": class_coverage,
+        "overall_coverage": (
+            (function_coverage + class_coverage) / 2
+            if total_functions + total_classes > 0 else 100
+        )
+    }
+    return file_metrics, None
+
+
+def _load_docs_cache() -> Dict[str, list]:
+    """
+    Read the per-file metrics cache.
+    A missing, corrupt or differently versioned cache is empty.
+    """
+    try:
+        with open(DOCS_CACHE, encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(cache, dict) or cache.get("version") != DOCS_CACHE_VERSION:
+        return {}
+    files = cache.get("files")
+    return files if isinstance(files, dict) else {}
+
+
+def _save_docs_cache(cache: Dict[str, list]) -> None:
+    """Write the per-file metrics cache; failing to write it is not an error."""
+    tmp_path = DOCS_CACHE + ".tmp"
+    try:
+        # Swap in a fully written file, so readers never see a partial cache
+        with open(tmp_path, "w", encoding='utf-8') as f:
+            json.dump({"version": DOCS_CACHE_VERSION, "files": cache}, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, DOCS_CACHE)
+    except OSError:
+        pass
+
+
 def check_docstrings(directory: str = ".", pattern: str = "*.py") -> Dict[str, float]:
     """Check Python files for docstrings and return coverage metrics."""
     metrics = {
@@ -85,70 +256,56 @@ def check_docstrings(directory: str = ".", pattern: str = "*.py") -> Dict[str, f
         "docs/examples"
     ]
 
-    for project_dir in project_dirs:
-        dir_path = Path(project_dir)
-        if not dir_path.exists():
-            continue
+    matches = re.compile(fnmatch.translate(pattern)).match
+    py_files = [
+        py_file
+        for project_dir in project_dirs if os.path.isdir(project_dir)
+        for py_file in _iter_files(project_dir, matches)
+    ]
 
-        for py_file in dir_path.rglob(pattern):
-            try:
-                with open(py_file, encoding='utf-8') as f:
-                    content = f.read()
-
-                file_metrics = {
-                    "total_functions": 0,
-                    "documented_functions": 0,
-                    "total_classes": 0,
-                    "documented_classes": 0
-                }
-
-                # Find all function definitions
-                function_matches = re.finditer(r"def\s+(\w+)\s*\(", content)
-                class_matches = re.finditer(r"class\s+(\w+)\s*[:\(]", content)
-
-                for match in function_matches:
-                    file_metrics["total_functions"] += 1
-                    metrics["total_functions"] += 1
-                    # Check for docstring after function definition
-                    pos = match.end()
-                    next_lines = content[pos:pos+500]  # Look at next 500 chars
-                    if re.search(r'\s*["\']""[\s\S]*?["\']""|\s*\'\'\'[\s\S]*?\'\'\'', next_lines):
-                        file_metrics["documented_functions"] += 1
-                        metrics["documented_functions"] += 1
-
-                for match in class_matches:
-                    file_metrics["total_classes"] += 1
-                    metrics["total_classes"] += 1
-                    pos = match.end()
-                    next_lines = content[pos:pos+500]  # Look at next 500 chars
-                    if re.search(r'\s*["\']""[\s\S]*?["\']""|\s*\'\'\'[\s\S]*?\'\'\'', next_lines):
-                        file_metrics["documented_classes"] += 1
-                        metrics["documented_classes"] += 1
-
-                # Calculate file-level coverage
-                file_metrics["function_coverage"] = (
-                    (file_metrics["documented_functions"] /
-                     file_metrics["total_functions"] * 100)
-                    if file_metrics["total_functions"] > 0 else 100
-                )
-                file_metrics["class_coverage"] = (
-                    (file_metrics["documented_classes"] /
-                     file_metrics["total_classes"] * 100)
-                    if file_metrics["total_classes"] > 0 else 100
-                )
-                file_metrics["overall_coverage"] = (
-                    (file_metrics["function_coverage"] +
-                     file_metrics["class_coverage"]) / 2
-                    if file_metrics["total_functions"] + file_metrics["total_classes"] > 0
-                    else 100
-                )
-
-                metrics["files"][str(py_file)] = file_metrics
-
-            except (UnicodeDecodeError, IOError) as e:
-                print(
-                    f"Warning: Could not process file {py_file}: {e}", file=sys.stderr)
-                continue
+    # Reuse the metrics of files unchanged since the last run; only the
+    # rest are read and parsed
+    cache = _load_docs_cache()
+    fresh_cache = {}
+    results = {}
+    stale = []
+    for py_file in py_files:
+        try:
+            st = os.stat(py_file)
+        except OSError:
+            stale.append(py_file)
+            continue
+        stamp = [st.st_mtime_ns, st.st_size]
+        entry = cache.get(py_file)
+        if entry is not None and entry[:2] == stamp:
+            results[py_file] = (entry[2], None)
+            fresh_cache[py_file] = entry
+        else:
+            stale.append(py_file)
+            fresh_cache[py_file] = stamp
+
+    if len(stale) < PARALLEL_MIN_FILES:
+        scored = map(_score_file, stale)
+    else:
+        # Parsing is CPU-bound, so spread large trees over worker processes
+        with ProcessPoolExecutor() as executor:
+            scored = list(executor.map(_score_file, stale, chunksize=32))
+    for py_file, result in zip(stale, scored):
+        results[py_file] = result
+        stamp = fresh_cache.pop(py_file, None)
+        if stamp is not None and result[0] is not None:
+            fresh_cache[py_file] = stamp + [result[0]]
+    _save_docs_cache(fresh_cache)
+
+    for py_file in py_files:
+        file_metrics, warning = results[py_file]
+        if file_metrics is None:
+            print(warning, file=sys.stderr)
+            continue
+        for key in ("total_functions", "documented_functions",
+                    "total_classes", "documented_classes"):
+            metrics[key] += file_metrics[key]
+        metrics["files"][py_file] = file_metrics
 
     # Calculate overall coverage percentages
     metrics["function_coverage"] = (
@@ -163,48 +320,49 @@ def check_docstrings(directory: str = ".", pattern: str = "*.py") -> Dict[str, f
     return metrics
 
 
-def generate_docs_report(metrics: Dict[str, float], missing_sections: List[str], existing_components: List[str]) -> str:
-    """Generate a documentation status report."""
-    report = ["# Documentation Status Report", ""]
+def _report_lines(metrics: Dict[str, float], missing_sections: List[str],
+                  existing_components: List[str]) -> Iterator[str]:
+    """Yield the lines of the documentation status report."""
+    yield "# Documentation Status Report"
+    yield ""
 
     # README.md status
-    report.append("## README.md Status")
+    yield "## README.md Status"
     if not missing_sections:
-        report.append("✅ README.md is complete with all required sections")
+        yield "✅ README.md is complete with all required sections"
     else:
-        report.append("⚠️ README.md is missing the following sections:")
+        yield "⚠️ README.md is missing the following sections:"
         for section in missing_sections:
-            report.append(f"  - {section}")
-    report.append("")
+            yield f"  - {section}"
+    yield ""
 
     # Documentation structure
-    report.append("## Documentation Structure")
+    yield "## Documentation Structure"
     if existing_components:
-        report.append("✅ Found the following documentation components:")
+        yield "✅ Found the following documentation components:"
         for component in existing_components:
-            report.append(f"  - {component}")
+            yield f"  - {component}"
     else:
-        report.append("⚠️ No documentation structure found")
-    report.append("")
+        yield "⚠️ No documentation structure found"
+    yield ""
 
     # Docstring Coverage
-    report.append("## Docstring Coverage")
-    report.append(
-        f"- Functions: {metrics['function_coverage']:.1f}% ({metrics['documented_functions']}/{metrics['total_functions']})")
-    report.append(
-        f"- Classes: {metrics['class_coverage']:.1f}% ({metrics['documented_classes']}/{metrics['total_classes']})")
-    report.append("")
+    yield "## Docstring Coverage"
+    yield f"- Functions: {metrics['function_coverage']:.1f}% ({metrics['documented_functions']}/{metrics['total_functions']})"
+    yield f"- Classes: {metrics['class_coverage']:.1f}% ({metrics['documented_classes']}/{metrics['total_classes']})"
+    yield ""
 
     # Per-file Coverage
-    report.append("## Per-file Coverage")
-    report.append("| File | Functions | Classes | Overall |")
-    report.append("|------|-----------|----------|----------|")
+    yield "## Per-file Coverage"
+    yield "| File | Functions | Classes | Overall |"
+    yield "|------|-----------|----------|----------|"
     for file_path, file_metrics in sorted(metrics["files"].items(), key=lambda x: x[1]["overall_coverage"]):
-        report.append(
-            f"| {file_path} | {file_metrics['function_coverage']:.1f}% | {file_metrics['class_coverage']:.1f}% | {file_metrics['overall_coverage']:.1f}% |"
-        )
+        yield f"| {file_path} | {file_metrics['function_coverage']:.1f}% | {file_metrics['class_coverage']:.1f}% | {file_metrics['overall_coverage']:.1f}% |"
 
-    return "\n".join(report)
+
+def generate_docs_report(metrics: Dict[str, float], missing_sections: List[str], existing_components: List[str]) -> str:
+    """Generate a documentation status report."""
+    return "\n".join(_report_lines(metrics, missing_sections, existing_components))
 
 
 def main():
@@ -220,15 +378,12 @@ def main():
     }
 
     # Check README.md
-    readme_exists, missing_sections = check_readme()
-    if not readme_exists:
+    readme_score, missing_sections = check_readme()
+    if not readme_score:
         validation_results["success"] = False
         validation_results["messages"].append("README.md is missing")
     else:
-        # Calculate score based on found sections (6 - missing)
-        validation_results["metrics"]["readme_score"] = (
-            (6 - len(missing_sections)) / 6 * 100  # 6 required sections
-        )
+        validation_results["metrics"]["readme_score"] = readme_score
         if missing_sections:
             validation_results["messages"].append(
                 f"README.md is missing sections: {', '.join(missing_sections)}"
@@ -254,7 +409,7 @@ def main():
     # Generate documentation report
     report = generate_docs_report(
         docstring_metrics,
-        missing_sections if readme_exists else [],
+        missing_sections if readme_score else [],
         existing_components if structure_exists else []
     )
 